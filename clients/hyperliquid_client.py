@@ -8,24 +8,50 @@ Components:
     Info     – read-only: market data, positions, orders, fills
     Exchange – write: place/cancel orders, set leverage, market open/close
 
+Performance notes:
+    This client is I/O-bound.  Every hot path waits on a Hyperliquid REST
+    POST (``/info`` or ``/exchange``) made by the SDK's synchronous
+    ``requests`` session; there are no tight numeric loops worth
+    vectorising.  Optimisations therefore target the network and the data
+    layout: fewer round-trips (caching, coalescing, batching, WebSocket
+    push), not blocking the event loop, and cheap parsing of responses.
+
 Configuration via env vars:
     HYPERLIQUID_WALLET_ADDRESS – your 0x address (required for read ops)
     HYPERLIQUID_PRIVATE_KEY    – hex private key (required for write ops)
     HYPERLIQUID_NETWORK        – "mainnet" (default) or "testnet"
+    HYPERLIQUID_USE_WS         – "1" (default) to stream market data over
+                                 the WebSocket feed, "0" to poll REST only
+    HYPERLIQUID_KEEP_RAW       – "1" to keep raw API payloads on results
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from itertools import islice
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+
+import orjson
 
-from eth_account import Account as EthAccount
-from hyperliquid.exchange import Exchange
-from hyperliquid.info import Info
-from hyperliquid.utils import constants
+from clients.ratelimit import TokenBucket
+
+# The SDK, eth_account and requests are slow to import; they are loaded on
+# first use so importing this module (e.g. to read config) stays cheap.
+if TYPE_CHECKING:
+    import requests
+    from eth_account.signers.local import LocalAccount
+    from hyperliquid.api import API
+    from hyperliquid.exchange import Exchange
+    from hyperliquid.info import Info
+    from hyperliquid.websocket_manager import WebsocketManager
 
 logger = logging.getLogger("agent_of_sats.hyperliquid")
 
@@ -33,12 +59,50 @@ logger = logging.getLogger("agent_of_sats.hyperliquid")
 
 BTC_SYMBOL = "BTC"
 
+# metaAndAssetCtxs refresh interval for asset contexts (prices, funding)
+META_CTX_TTL_S = 5.0
+# Default funding-history window (one week)
+FUNDING_LOOKBACK_MS = 7 * 86_400_000
+# REST allMids reuse window when the feed is unavailable (coalesces bursts)
+MIDS_TTL_S = 0.1
+
+# SDK worker threads; the HTTP connection pool is sized to match so every
+# worker can hold a kept-alive connection.
+SDK_POOL_SIZE = 8
+HTTP_CONNECT_TIMEOUT_S = 3.0
+
+# Local request budget burst size and HTTP 429 backoff schedule (seconds)
+RATE_LIMIT_BURST = 20
+RATE_LIMIT_BACKOFF_S = (2.0, 4.0, 8.0, 16.0, 30.0)
+
+
+# Order status strings that mean the order went through, and is_buy → side
+_FILLED_STR = frozenset({"filled", "ok", "success"})
+_SIDES = {True: "buy", False: "sell"}
+_EMPTY: dict[str, Any] = {}
+
 
-@dataclass
+def _f(d: dict[str, Any], k: str, default: Any = 0.0) -> Any:
+    """``float(d[k])``, or ``default`` when the key is missing, null or empty."""
+    v = d.get(k)
+    if not v:
+        return default
+    return v if type(v) is float else float(v)
+
+
+@dataclass(slots=True)
 class HyperliquidConfig:
     wallet_address: str = ""
     private_key: str = ""
     network: str = ""
+    use_websocket: bool | None = None
+    ws_max_age_s: float = 5.0  # fall back to REST when the feed is older
+    keep_raw: bool | None = None  # attach API payloads to results (debugging)
+    http_timeout_s: float = 15.0  # read timeout for REST calls
+    max_info_per_minute: int = 1200  # local cap on /info + /exchange calls
+    _wallet: LocalAccount | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self.wallet_address = self.wallet_address or os.getenv(
@@ -50,16 +114,29 @@ class HyperliquidConfig:
         self.network = self.network or os.getenv(
             "HYPERLIQUID_NETWORK", "mainnet"
         )
+        if self.use_websocket is None:
+            self.use_websocket = os.getenv("HYPERLIQUID_USE_WS", "1").lower() not in (
+                "0", "false", "no",
+            )
+        if self.keep_raw is None:
+            self.keep_raw = os.getenv("HYPERLIQUID_KEEP_RAW", "0").lower() in (
+                "1", "true", "yes",
+            )
 
-        # Derive address from private key if address not provided
-        if self.private_key and not self.wallet_address:
-            key = self.private_key
-            if not key.startswith("0x"):
-                key = "0x" + key
-            self.wallet_address = EthAccount.from_key(key).address
+        # Derive the signing wallet once; reuse its address if none provided
+        if self.private_key:
+            if not self.private_key.startswith("0x"):
+                self.private_key = "0x" + self.private_key
+            from eth_account import Account as EthAccount
+
+            self._wallet = EthAccount.from_key(self.private_key)
+            if not self.wallet_address:
+                self.wallet_address = self._wallet.address
 
     @property
     def base_url(self) -> str:
+        from hyperliquid.utils import constants
+
         return (
             constants.MAINNET_API_URL
             if self.network == "mainnet"
@@ -78,7 +155,7 @@ class HyperliquidConfig:
 # ── Data classes ────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketInfo:
     symbol: str
     mark_price: float
@@ -87,10 +164,10 @@ class MarketInfo:
     open_interest: float
     day_ntl_vlm: float = 0.0
     premium: float = 0.0
-    raw: dict = field(default_factory=dict)
+    raw: dict | None = None  # API payload, kept only with keep_raw
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     symbol: str
     size: float  # positive = long, negative = short
@@ -100,20 +177,20 @@ class Position:
     leverage: float
     margin_used: float = 0.0
     liquidation_price: float | None = None
-    raw: dict = field(default_factory=dict)
+    raw: dict | None = None  # API payload, kept only with keep_raw
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountSummary:
     account_value: float
     total_ntl_pos: float
     total_margin_used: float
     withdrawable: float
     positions: list[Position] = field(default_factory=list)
-    raw: dict = field(default_factory=dict)
+    raw: dict | None = None  # API payload, kept only with keep_raw
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     order_id: str
     symbol: str
@@ -122,10 +199,10 @@ class OrderResult:
     price: float | None
     order_type: str
     status: str
-    raw: dict = field(default_factory=dict)
+    raw: dict | None = None  # API payload, kept only with keep_raw
 
 
-@dataclass
+@dataclass(slots=True)
 class Fill:
     symbol: str
     side: str
@@ -133,7 +210,261 @@ class Fill:
     price: float
     fee: float
     time: str
-    raw: dict = field(default_factory=dict)
+    raw: dict | None = None  # API payload, kept only with keep_raw
+
+
+# ── Market data feed ────────────────────────────────────────────────────────
+
+
+class _MarketFeed:
+    """
+    Push-based market data snapshot fed by the Hyperliquid WebSocket.
+
+    Subscribes to ``allMids`` plus ``activeAssetCtx`` / ``l2Book`` for each
+    tracked coin and keeps the latest message per channel in memory, so
+    readers get an O(1) dict lookup instead of an ``/info`` round-trip.
+
+    The SDK's ``WebsocketManager`` does not reconnect on its own; the feed
+    runs it in a supervisor thread that reconnects with exponential backoff.
+    Callbacks replace whole values, so readers need no lock.
+    """
+
+    def __init__(self, base_url: str, coins: tuple[str, ...]):
+        self._base_url = base_url
+        self._coins = coins
+        self._manager: WebsocketManager | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="hyperliquid-ws", daemon=True
+        )
+
+        self.mids: Mapping[str, float] = MappingProxyType({})
+        self.ctxs: dict[str, dict] = {}
+        self.books: dict[str, dict] = {}
+        self._updated: dict[str, float] = {}
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._manager is not None:
+            self._manager.stop()
+
+    def is_fresh(self, key: str, max_age_s: float) -> bool:
+        """True if channel *key* was updated within the last *max_age_s*."""
+        ts = self._updated.get(key)
+        return ts is not None and time.monotonic() - ts < max_age_s
+
+    # ── supervisor ───────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        from hyperliquid.websocket_manager import WebsocketManager
+
+        backoff = 1.0
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                manager = WebsocketManager(self._base_url)
+                manager.subscribe({"type": "allMids"}, self._on_mids)
+                for coin in self._coins:
+                    manager.subscribe(
+                        {"type": "activeAssetCtx", "coin": coin}, self._on_ctx
+                    )
+                    manager.subscribe({"type": "l2Book", "coin": coin}, self._on_book)
+                self._manager = manager
+                manager.run()  # blocks until the socket closes
+                manager.stop()
+            except Exception as exc:
+                logger.warning("Hyperliquid WebSocket error: %s", exc)
+
+            if self._stop.is_set():
+                break
+            if time.monotonic() - started > 60:
+                backoff = 1.0
+            logger.info("Hyperliquid WebSocket closed — reconnecting in %.0fs", backoff)
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    # ── callbacks (WebSocket thread) ─────────────────────────────────
+
+    def _on_mids(self, msg: dict) -> None:
+        mids = msg["data"]["mids"]
+        self.mids = MappingProxyType({k: float(v) for k, v in mids.items()})
+        self._updated["allMids"] = time.monotonic()
+
+    def _on_ctx(self, msg: dict) -> None:
+        data = msg["data"]
+        self.ctxs[data["coin"]] = data["ctx"]
+        self._updated["ctx:" + data["coin"]] = time.monotonic()
+
+    def _on_book(self, msg: dict) -> None:
+        data = msg["data"]
+        self.books[data["coin"]] = data
+        self._updated["book:" + data["coin"]] = time.monotonic()
+
+
+def _split_statuses(result: Any, n: int) -> list[Any]:
+    """
+    Split a bulk order response into one single-status response per order.
+
+    Responses without per-order statuses (e.g. a rejected action) are
+    returned as-is for every order.
+    """
+    resp = result.get("response") if type(result) is dict else None
+    data = resp.get("data") if type(resp) is dict else None
+    statuses = data.get("statuses") if type(data) is dict else None
+    if not statuses or len(statuses) != n:
+        return [result] * n
+    return [{"response": {"data": {"statuses": [st]}}} for st in statuses]
+
+
+def _slippage_px(px: float, is_buy: bool, slippage: float, sz_decimals: int) -> float:
+    """
+    IoC limit price *slippage* away from *px*, rounded the way the SDK's
+    ``market_open``/``market_close`` round perp prices: 5 significant
+    figures and at most ``6 - szDecimals`` decimals.
+    """
+    px *= (1 + slippage) if is_buy else (1 - slippage)
+    return round(float(f"{px:.5g}"), 6 - sz_decimals)
+
+
+# ── Signing ─────────────────────────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=1)
+def _l1_hash_constants() -> tuple[bytes, bytes, dict[bool, bytes]]:
+    """
+    EIP-712 pieces of the SDK's L1 ``Agent`` payload that never change.
+
+    Returns the domain separator (chainId 1337, "Exchange", version "1",
+    zero verifying contract), the ``Agent`` type hash, and the hashed
+    ``source`` field for mainnet ("a") and testnet ("b").
+    """
+    from eth_utils import keccak
+
+    domain_typehash = keccak(
+        b"EIP712Domain(string name,string version,uint256 chainId,"
+        b"address verifyingContract)"
+    )
+    domain_separator = keccak(
+        domain_typehash
+        + keccak(b"Exchange")
+        + keccak(b"1")
+        + (1337).to_bytes(32, "big")
+        + bytes(32)
+    )
+    agent_typehash = keccak(b"Agent(string source,bytes32 connectionId)")
+    return domain_separator, agent_typehash, {True: keccak(b"a"), False: keccak(b"b")}
+
+
+# Signature of ``hyperliquid.utils.signing.sign_l1_action`` that the fast
+# path replicates; other SDK versions keep their own signer.
+_L1_SIGNER_PARAMS = (
+    "wallet",
+    "action",
+    "active_pool",
+    "nonce",
+    "expires_after",
+    "is_mainnet",
+)
+
+
+def _fast_sign_l1_action(
+    wallet: Any,
+    action: Any,
+    active_pool: Any,
+    nonce: int,
+    expires_after: int | None,
+    is_mainnet: bool,
+) -> dict[str, Any]:
+    """
+    Drop-in for ``hyperliquid.utils.signing.sign_l1_action``.
+
+    Hashes the ``Agent`` struct directly against the precomputed domain
+    separator instead of rebuilding and re-encoding the typed-data payload
+    on every order; the resulting signature is identical.  Wallets without
+    ``unsafe_sign_hash`` (eth-account < 0.13) go through the SDK signer.
+    """
+    from eth_utils import keccak, to_hex
+    from hyperliquid.utils import signing
+    from hyperliquid.utils.signing import action_hash
+
+    if not hasattr(wallet, "unsafe_sign_hash"):
+        return signing.sign_l1_action(
+            wallet, action, active_pool, nonce, expires_after, is_mainnet
+        )
+
+    domain_separator, agent_typehash, source_hash = _l1_hash_constants()
+    connection_id = action_hash(action, active_pool, nonce, expires_after)
+    struct_hash = keccak(agent_typehash + source_hash[is_mainnet] + connection_id)
+    signed = wallet.unsafe_sign_hash(
+        keccak(b"\x19\x01" + domain_separator + struct_hash)
+    )
+    return {"r": to_hex(signed.r), "s": to_hex(signed.s), "v": signed.v}
+
+
+def _install_fast_signer() -> None:
+    """
+    Route the SDK ``Exchange``'s L1 action signing through the fast path,
+    provided the installed SDK's ``sign_l1_action`` has the signature it
+    replicates; otherwise the SDK signer is left in place.
+    """
+    import inspect
+
+    import hyperliquid.exchange
+    from hyperliquid.utils import signing
+
+    params = tuple(inspect.signature(signing.sign_l1_action).parameters)
+    if params != _L1_SIGNER_PARAMS:
+        logger.info("Keeping the SDK L1 signer (sign_l1_action%s)", params)
+        return
+    hyperliquid.exchange.sign_l1_action = _fast_sign_l1_action
+
+
+# ── Transport ───────────────────────────────────────────────────────────────
+
+
+def _orjson_post(api: API, url_path: str, payload: Any = None) -> Any:
+    """``API.post`` with orjson encoding/decoding in place of stdlib json."""
+    response = api.session.post(
+        api.base_url + url_path,
+        data=orjson.dumps(payload or {}),
+        timeout=api.timeout,
+    )
+    api._handle_exception(response)
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return {"error": f"Could not parse JSON: {response.text}"}
+
+
+def _http_session() -> requests.Session:
+    """
+    Keep-alive session shared by every SDK client.
+
+    The pool holds one connection per SDK worker thread.  Only connection
+    failures are retried (urllib3 never replays a POST once it was sent),
+    so order submission stays at-most-once.
+    """
+    import requests
+
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=SDK_POOL_SIZE, max_retries=2
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _configure_api(api: API, session: requests.Session, timeout: Any) -> None:
+    """Point an SDK client at the shared session and orjson transport."""
+    api.session.close()
+    api.session = session
+    api.timeout = timeout
+    api.post = functools.partial(_orjson_post, api)  # type: ignore[method-assign]
 
 
 # ── Client ──────────────────────────────────────────────────────────────────
@@ -151,19 +482,33 @@ class HyperliquidPerpsClient:
     """
 
     def __init__(self, config: HyperliquidConfig | None = None):
+        from hyperliquid.exchange import Exchange
+        from hyperliquid.info import Info
+
         self.cfg = config or HyperliquidConfig()
 
+        # The SDK is synchronous (``requests``); its calls run on this pool
+        # so they never block the event loop.  Bounded to cap concurrency.
+        self._pool = ThreadPoolExecutor(
+            max_workers=SDK_POOL_SIZE, thread_name_prefix="hyperliquid"
+        )
+        self._session = _http_session()
+        self._bucket = TokenBucket(
+            rate=self.cfg.max_info_per_minute / 60, capacity=RATE_LIMIT_BURST
+        )
+        timeout = (HTTP_CONNECT_TIMEOUT_S, self.cfg.http_timeout_s)
+
         # Info client (read-only, always available)
         self._info = Info(self.cfg.base_url, skip_ws=True)
+        _configure_api(self._info, self._session, timeout)
 
         # Exchange client (write ops, needs private key)
         self._exchange: Exchange | None = None
         if self.cfg.can_trade:
-            key = self.cfg.private_key
-            if not key.startswith("0x"):
-                key = "0x" + key
-            wallet = EthAccount.from_key(key)
-            self._exchange = Exchange(wallet, self.cfg.base_url)
+            _install_fast_signer()
+            self._exchange = Exchange(self.cfg._wallet, self.cfg.base_url)
+            _configure_api(self._exchange, self._session, timeout)
+            _configure_api(self._exchange.info, self._session, timeout)
             logger.info(
                 "Hyperliquid client ready (read+write) on %s for %s",
                 self.cfg.network,
@@ -180,8 +525,30 @@ class HyperliquidPerpsClient:
                 "Hyperliquid client has no wallet address — limited to public market data"
             )
 
-        # Cache meta on init for name→asset mapping
-        self._meta: dict | None = None
+        # Cached asset contexts and universe name→index / szDecimals maps
+        self._ctxs_cache: tuple[float, list[dict[str, Any]]] | None = None
+        self._name_to_idx: dict[str, int] = {}
+        self._sz_decimals: dict[str, int] = {}
+        self._universe: tuple[str, ...] = ()
+
+        # Short-lived clearinghouseState cache shared by account/position reads
+        self._user_state_lock = asyncio.Lock()
+        self._user_state_cache: tuple[float, dict[str, Any]] | None = None
+        self._user_state_ttl = 0.5
+        # Bumped by every trading call; a fetch that straddles one is stale.
+        self._user_state_gen = 0
+
+        # Parsed REST allMids, used when the feed is stale
+        self._mids_cache: tuple[float, Mapping[str, float]] | None = None
+
+        # In-flight /info requests, keyed by (method, args), for coalescing
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+        # Streaming market data (BTC ctx/book + all mids)
+        self._feed: _MarketFeed | None = None
+        if self.cfg.use_websocket:
+            self._feed = _MarketFeed(self.cfg.base_url, (BTC_SYMBOL,))
+            self._feed.start()
 
     # ─── Market Data ────────────────────────────────────────────────────
 
@@ -191,87 +558,103 @@ class HyperliquidPerpsClient:
 
     async def get_market_info(self, symbol: str = "BTC") -> MarketInfo:
         """Fetch perp market info for any symbol."""
-        data = self._info.meta_and_asset_ctxs()
-        meta = data[0]
-        asset_ctxs = data[1]
-
-        idx = None
-        for i, asset in enumerate(meta.get("universe", [])):
-            if asset.get("name") == symbol:
-                idx = i
-                break
+        feed = self._feed
+        if feed and feed.is_fresh("ctx:" + symbol, self.cfg.ws_max_age_s):
+            return self._market_info_from_ctx(symbol, feed.ctxs[symbol])
 
+        asset_ctxs = await self._asset_ctxs()
+        idx = self._name_to_idx.get(symbol)
         if idx is None or idx >= len(asset_ctxs):
             raise ValueError(f"{symbol} not found in Hyperliquid universe")
 
-        ctx = asset_ctxs[idx]
-        mark = float(ctx.get("markPx", 0))
-        oracle = float(ctx.get("oraclePx", 0))
+        return self._market_info_from_ctx(symbol, asset_ctxs[idx])
 
-        return MarketInfo(
-            symbol=symbol,
-            mark_price=mark,
-            index_price=oracle,
-            funding_rate=float(ctx.get("funding", 0)),
-            open_interest=float(ctx.get("openInterest", 0)),
-            day_ntl_vlm=float(ctx.get("dayNtlVlm", 0)),
-            premium=float(ctx.get("premium", 0)),
-            raw=ctx,
-        )
+    async def get_all_mids(self) -> Mapping[str, float]:
+        """
+        Get mid prices for all perp markets.
 
-    async def get_all_mids(self) -> dict[str, float]:
-        """Get mid prices for all perp markets."""
-        mids = self._info.all_mids()
-        return {k: float(v) for k, v in mids.items()}
+        Returns a read-only view that is parsed once per update and shared
+        between callers; copy it with ``dict(...)`` to modify.
+        """
+        feed = self._feed
+        if feed and feed.is_fresh("allMids", self.cfg.ws_max_age_s):
+            return feed.mids
+        cached = self._mids_cache
+        if cached is not None and time.monotonic() - cached[0] < MIDS_TTL_S:
+            return cached[1]
+        raw = await self._info_call("all_mids")
+        mids = MappingProxyType({k: float(v) for k, v in raw.items()})
+        self._mids_cache = (time.monotonic(), mids)
+        return mids
 
     async def get_orderbook(self, symbol: str = "BTC") -> dict[str, Any]:
         """Get L2 order book snapshot for a symbol."""
-        return self._info.l2_snapshot(symbol)
+        feed = self._feed
+        if feed and feed.is_fresh("book:" + symbol, self.cfg.ws_max_age_s):
+            return feed.books[symbol]
+        return await self._info_call("l2_snapshot", symbol)
+
+    async def _asset_ctxs(self) -> list[dict[str, Any]]:
+        """Return perp asset contexts, refetching at most every META_CTX_TTL_S."""
+        now = time.monotonic()
+        cached = self._ctxs_cache
+        if cached is not None and now - cached[0] < META_CTX_TTL_S:
+            return cached[1]
+
+        meta, asset_ctxs = await self._info_call("meta_and_asset_ctxs")
+        # Rebuild the name→index map only when the listed universe changes
+        universe = meta.get("universe", [])
+        names = tuple(a["name"] for a in universe)
+        if names != self._universe:
+            self._name_to_idx = {name: i for i, name in enumerate(names)}
+            self._sz_decimals = {a["name"]: a["szDecimals"] for a in universe}
+            self._universe = names
+        self._ctxs_cache = (now, asset_ctxs)
+        return asset_ctxs
 
     # ─── Account / Positions ────────────────────────────────────────────
 
     async def get_account_summary(self) -> AccountSummary:
         """Get full account state: margin, positions, withdrawable."""
         self._require_address()
-        state = self._info.user_state(self.cfg.wallet_address)
+        state = await self._user_state()
 
         margin = state.get("crossMarginSummary", state.get("marginSummary", {}))
-        positions = []
-
-        for ap in state.get("assetPositions", []):
-            p = ap.get("position", {})
-            sz = float(p.get("szi", 0))
-            if sz == 0:
+        keep_raw = self.cfg.keep_raw
+        positions: list[Position] = []
+
+        # Hot loop: bind lookups locally
+        append = positions.append
+        _float = float
+        f = _f
+        for ap in state.get("assetPositions", ()):
+            p = ap.get("position") or _EMPTY
+            sz = _float(p.get("szi") or 0)
+            if not sz:
                 continue
-            positions.append(
+            lev_raw = p.get("leverage")
+            lev = lev_raw.get("value", 1) if type(lev_raw) is dict else (lev_raw or 1)
+            append(
                 Position(
                     symbol=p.get("coin", ""),
                     size=sz,
-                    entry_price=float(p.get("entryPx", 0)),
-                    mark_price=float(p.get("markPx", 0)) if p.get("markPx") else 0,
-                    unrealized_pnl=float(p.get("unrealizedPnl", 0)),
-                    leverage=float(
-                        p.get("leverage", {}).get("value", 1)
-                        if isinstance(p.get("leverage"), dict)
-                        else p.get("leverage", 1)
-                    ),
-                    margin_used=float(p.get("marginUsed", 0)),
-                    liquidation_price=(
-                        float(p["liquidationPx"])
-                        if p.get("liquidationPx")
-                        else None
-                    ),
-                    raw=p,
+                    entry_price=f(p, "entryPx"),
+                    mark_price=f(p, "markPx"),
+                    unrealized_pnl=f(p, "unrealizedPnl"),
+                    leverage=_float(lev),
+                    margin_used=f(p, "marginUsed"),
+                    liquidation_price=f(p, "liquidationPx", None),
+                    raw=p if keep_raw else None,
                 )
             )
 
         return AccountSummary(
-            account_value=float(margin.get("accountValue", 0)),
-            total_ntl_pos=float(margin.get("totalNtlPos", 0)),
-            total_margin_used=float(margin.get("totalMarginUsed", 0)),
-            withdrawable=float(state.get("withdrawable", 0)),
+            account_value=_f(margin, "accountValue"),
+            total_ntl_pos=_f(margin, "totalNtlPos"),
+            total_margin_used=_f(margin, "totalMarginUsed"),
+            withdrawable=_f(state, "withdrawable"),
             positions=positions,
-            raw=state,
+            raw=state if self.cfg.keep_raw else None,
         )
 
     async def get_positions(self) -> list[Position]:
@@ -282,33 +665,44 @@ class HyperliquidPerpsClient:
     async def get_open_orders(self) -> list[dict[str, Any]]:
         """Return open orders for the configured wallet."""
         self._require_address()
-        return self._info.open_orders(self.cfg.wallet_address)
+        return await self._info_call("open_orders", self.cfg.wallet_address)
 
     async def get_fills(self, limit: int = 50) -> list[Fill]:
         """Return recent fills for the configured wallet."""
         self._require_address()
-        raw_fills = self._info.user_fills(self.cfg.wallet_address)
-        fills = []
-        for f in raw_fills[:limit]:
-            fills.append(
-                Fill(
-                    symbol=f.get("coin", ""),
-                    side=f.get("side", ""),
-                    size=float(f.get("sz", 0)),
-                    price=float(f.get("px", 0)),
-                    fee=float(f.get("fee", 0)),
-                    time=f.get("time", ""),
-                    raw=f,
-                )
+        raw_fills = await self._info_call("user_fills", self.cfg.wallet_address)
+        keep_raw = self.cfg.keep_raw
+        # userFills is newest-first; only the first *limit* entries are parsed
+        return [
+            Fill(
+                symbol=f.get("coin", ""),
+                side=f.get("side", ""),
+                size=_f(f, "sz"),
+                price=_f(f, "px"),
+                fee=_f(f, "fee"),
+                time=f.get("time", ""),
+                raw=f if keep_raw else None,
             )
-        return fills
+            for f in islice(raw_fills, limit)
+        ]
 
-    async def get_funding_history(self, limit: int = 20) -> list[dict[str, Any]]:
-        """Return funding payment history for the configured wallet."""
+    async def get_funding_history(
+        self, limit: int = 20, start_ms: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return funding payment history for the configured wallet.
+
+        *start_ms* defaults to one week ago so the server does not scan the
+        wallet's full history on every call.
+        """
         self._require_address()
-        return self._info.user_funding_history(
-            self.cfg.wallet_address, 0, int(time.time() * 1000)
-        )[:limit]
+        end_ms = time.time_ns() // 1_000_000
+        if start_ms is None:
+            start_ms = end_ms - FUNDING_LOOKBACK_MS
+        history = await self._info_call(
+            "user_funding_history", self.cfg.wallet_address, start_ms, end_ms
+        )
+        return history[:limit]
 
     # ─── Trading (requires private key) ─────────────────────────────────
 
@@ -327,7 +721,8 @@ class HyperliquidPerpsClient:
         """
         self._require_exchange()
 
-        result = self._exchange.market_open(  # type: ignore
+        result = await self._exchange_call(
+            "market_open",
             name=symbol,
             is_buy=is_buy,
             sz=size,
@@ -349,7 +744,8 @@ class HyperliquidPerpsClient:
         """
         self._require_exchange()
 
-        result = self._exchange.market_close(  # type: ignore
+        result = await self._exchange_call(
+            "market_close",
             coin=symbol,
             sz=size,
             slippage=slippage,
@@ -371,7 +767,8 @@ class HyperliquidPerpsClient:
         self._require_exchange()
 
         order_type = {"limit": {"tif": "Gtc"}}
-        result = self._exchange.order(  # type: ignore
+        result = await self._exchange_call(
+            "order",
             name=symbol,
             is_buy=is_buy,
             sz=size,
@@ -385,7 +782,7 @@ class HyperliquidPerpsClient:
     async def cancel_order(self, symbol: str, order_id: int) -> dict[str, Any]:
         """Cancel an open order by OID."""
         self._require_exchange()
-        return self._exchange.cancel(name=symbol, oid=order_id)  # type: ignore
+        return await self._exchange_call("cancel", name=symbol, oid=order_id)
 
     async def set_leverage(
         self,
@@ -395,29 +792,62 @@ class HyperliquidPerpsClient:
     ) -> dict[str, Any]:
         """Set leverage for a symbol (cross or isolated)."""
         self._require_exchange()
-        return self._exchange.update_leverage(  # type: ignore
+        return await self._exchange_call(
+            "update_leverage",
             leverage=leverage,
             name=symbol,
             is_cross=is_cross,
         )
 
-    async def close_all_positions(self, symbol: str) -> list[OrderResult]:
-        """Close all open positions for *symbol* with market orders."""
-        positions = await self.get_positions()
-        results: list[OrderResult] = []
-        for pos in positions:
-            if pos.symbol != symbol:
-                continue
-            result = await self.market_close(symbol=symbol, size=abs(pos.size))
-            results.append(result)
-        return results
+    async def close_all_positions(
+        self, symbol: str, slippage: float = 0.05
+    ) -> list[OrderResult]:
+        """
+        Close all open positions for *symbol* with market orders.
+
+        All closes go out as one signed ``bulk_orders`` action (reduce-only
+        IoC limits at the slippage-adjusted mid, like the SDK's
+        ``market_close``), so N positions cost one round-trip.
+        """
+        self._require_exchange()
+        positions = [p for p in await self.get_positions() if p.symbol == symbol]
+        if not positions:
+            return []
+
+        mids, _ = await asyncio.gather(self.get_all_mids(), self._asset_ctxs())
+        sz_decimals = self._sz_decimals.get(symbol)
+        if sz_decimals is None:
+            raise ValueError(f"{symbol} not found in Hyperliquid universe")
+        mid = mids.get(symbol)
+        orders = []
+        for p in positions:
+            is_buy = p.size < 0
+            orders.append(
+                {
+                    "coin": symbol,
+                    "is_buy": is_buy,
+                    "sz": abs(p.size),
+                    "limit_px": _slippage_px(
+                        mid or p.mark_price, is_buy, slippage, sz_decimals
+                    ),
+                    "order_type": {"limit": {"tif": "Ioc"}},
+                    "reduce_only": True,
+                }
+            )
+        result = await self._exchange_call("bulk_orders", order_requests=orders)
+        return [
+            self._parse_order_result(
+                part, symbol, order["is_buy"], order["sz"], "market_close"
+            )
+            for part, order in zip(_split_statuses(result, len(orders)), orders)
+        ]
 
     # ─── Connectivity ───────────────────────────────────────────────────
 
     async def is_connected(self) -> bool:
         """Quick health check – can we reach the Hyperliquid API?"""
         try:
-            self._info.meta()
+            await self._info_call("meta")
             return True
         except Exception:
             return False
@@ -426,13 +856,86 @@ class HyperliquidPerpsClient:
 
     async def close(self) -> None:
         """Disconnect any websocket connections."""
+        if self._feed is not None:
+            self._feed.stop()
         try:
             self._info.disconnect_websocket()
         except Exception:
             pass
+        self._pool.shutdown(wait=False)
+        self._session.close()
 
     # ─── Internal helpers ───────────────────────────────────────────────
 
+    async def _run(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking SDK call on the client's thread pool.
+
+        Each attempt takes a token from the client's bucket.  A 429 reply
+        means the request was rejected, so it is retried with exponential
+        backoff before the error is surfaced.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        for delay in (*RATE_LIMIT_BACKOFF_S, None):
+            await self._bucket.acquire()
+            try:
+                return await loop.run_in_executor(self._pool, call)
+            except Exception as exc:  # SDK ClientError carries status_code
+                if getattr(exc, "status_code", None) != 429 or delay is None:
+                    raise
+                logger.warning(
+                    "Hyperliquid rate limited (%s), retrying in %.0fs",
+                    getattr(fn, "__name__", fn),
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _info_call(self, method: str, *args: Any) -> Any:
+        """
+        Run an ``Info`` request off the event loop, coalescing duplicates.
+
+        Concurrent callers asking for the same ``(method, args)`` share one
+        in-flight ``/info`` POST instead of each issuing their own.
+        """
+        key = (method, args)
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._run(getattr(self._info, method), *args))
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _f: self._inflight.pop(key, None))
+        # shield: one caller being cancelled must not cancel the others
+        return await asyncio.shield(fut)
+
+    async def _user_state(self) -> dict[str, Any]:
+        """
+        Return the wallet's clearinghouseState, cached for ``_user_state_ttl``.
+
+        Lets get_account_summary / get_positions and the close-positions path
+        share one fetch; trading calls invalidate the cache, and a fetch
+        that was in flight during a trading call is returned but not cached.
+        """
+        cached = self._user_state_cache
+        if cached is not None and time.monotonic() - cached[0] < self._user_state_ttl:
+            return cached[1]
+        async with self._user_state_lock:
+            cached = self._user_state_cache
+            if cached is not None and time.monotonic() - cached[0] < self._user_state_ttl:
+                return cached[1]
+            gen = self._user_state_gen
+            state = await self._info_call("user_state", self.cfg.wallet_address)
+            if gen == self._user_state_gen:
+                self._user_state_cache = (time.monotonic(), state)
+            return state
+
+    async def _exchange_call(self, method: str, **kwargs: Any) -> Any:
+        """Run an ``Exchange`` action off-loop and drop cached account state."""
+        try:
+            return await self._run(getattr(self._exchange, method), **kwargs)
+        finally:
+            self._user_state_gen += 1
+            self._user_state_cache = None
+
     def _require_address(self) -> None:
         if not self.cfg.wallet_address:
             raise RuntimeError(
@@ -447,8 +950,21 @@ class HyperliquidPerpsClient:
                 "Set it in .env or pass it in HyperliquidConfig."
             )
 
-    @staticmethod
+    def _market_info_from_ctx(self, symbol: str, ctx: dict[str, Any]) -> MarketInfo:
+        """Build a MarketInfo from a perp asset context (REST or WebSocket)."""
+        return MarketInfo(
+            symbol=symbol,
+            mark_price=_f(ctx, "markPx"),
+            index_price=_f(ctx, "oraclePx"),
+            funding_rate=_f(ctx, "funding"),
+            open_interest=_f(ctx, "openInterest"),
+            day_ntl_vlm=_f(ctx, "dayNtlVlm"),
+            premium=_f(ctx, "premium"),
+            raw=ctx if self.cfg.keep_raw else None,
+        )
+
     def _parse_order_result(
+        self,
         result: Any,
         symbol: str,
         is_buy: bool | None,
@@ -456,33 +972,26 @@ class HyperliquidPerpsClient:
         order_type: str,
     ) -> OrderResult:
         """Parse the SDK's order response into our OrderResult dataclass."""
-        status_data = result.get("response", result) if isinstance(result, dict) else {}
-        data = status_data.get("data", {}) if isinstance(status_data, dict) else {}
+        # Expected shape: {"response": {"data": {"statuses": [s0, ...]}}}
+        resp = result.get("response", result) if type(result) is dict else None
+        data = resp.get("data") if type(resp) is dict else None
+        statuses = data.get("statuses") if type(data) is dict else None
+        s0 = statuses[0] if statuses else None
 
-        # The SDK returns nested structures — try to extract order info
-        statuses = data.get("statuses", []) if isinstance(data, dict) else []
         order_id = ""
         order_status = "unknown"
-
-        if statuses and isinstance(statuses[0], dict):
-            filled = statuses[0].get("filled", statuses[0].get("resting", {}))
-            if isinstance(filled, dict):
+        if type(s0) is dict:
+            filled = s0.get("filled") or s0.get("resting")
+            if type(filled) is dict:
                 order_id = str(filled.get("oid", ""))
-            elif isinstance(statuses[0], dict) and "error" in statuses[0]:
+                order_status = "submitted" if order_id else "unknown"
+            elif "error" in s0:
+                order_id = s0["error"]
                 order_status = "error"
-                order_id = statuses[0].get("error", "")
-            else:
-                order_id = str(statuses[0])
-                order_status = "filled" if "filled" in str(statuses[0]).lower() else "submitted"
-
-        if order_id and order_status == "unknown":
-            order_status = "submitted"
+        elif type(s0) is str:
+            order_status = "filled" if s0.lower() in _FILLED_STR else "submitted"
 
-        side = "unknown"
-        if is_buy is True:
-            side = "buy"
-        elif is_buy is False:
-            side = "sell"
+        side = _SIDES.get(is_buy, "unknown")
 
         return OrderResult(
             order_id=order_id,
@@ -492,5 +1001,9 @@ class HyperliquidPerpsClient:
             price=None,
             order_type=order_type,
             status=order_status,
-            raw=result if isinstance(result, dict) else {"raw": str(result)},
+            raw=(
+                (result if isinstance(result, dict) else {"raw": str(result)})
+                if self.cfg.keep_raw
+                else None
+            ),
         )
@@ -17,12 +17,20 @@ If the API is unreachable, methods raise so the caller can handle gracefully.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
-from dataclasses import dataclass
-from typing import Any
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Mapping
 
 import httpx
+import orjson
+
+from clients.ratelimit import TokenBucket, retry_after_s
 
 logger = logging.getLogger("agent_of_sats.lifi")
 
@@ -53,6 +61,9 @@ CHAIN_IDS: dict[str, int] = {
     "solana": 1151111081099710,
 }
 
+# Listed in resolve_chain_id's error message
+_CHAIN_IDS_SORTED_STR = ", ".join(sorted(CHAIN_IDS))
+
 # ── Well-known token addresses (by chain ID) ───────────────────────────────
 
 USDC_ADDRESSES: dict[int, str] = {
@@ -67,6 +78,8 @@ USDC_ADDRESSES: dict[int, str] = {
 
 NATIVE_TOKEN = "0x0000000000000000000000000000000000000000"
 
+_ADDR_RE = re.compile(r"^0x[0-9a-fA-F]{40}$").match
+
 # Token symbol shortcuts → address resolver
 TOKEN_SYMBOLS: dict[str, str] = {
     "ETH": NATIVE_TOKEN,
@@ -75,25 +88,53 @@ TOKEN_SYMBOLS: dict[str, str] = {
     "AVAX": NATIVE_TOKEN,
 }
 
+# Cache lifetimes for near-static reference data and for gas prices
+REFERENCE_TTL_S = 3600.0
+GAS_TTL_S = 10.0
+
+# Attempts per request when Li.Fi answers 429
+MAX_ATTEMPTS = 4
+
+# Transfer states after which /status will not change
+_TERMINAL_STATUS = frozenset({"DONE", "FAILED"})
+_TERMINAL_SUBSTATUS = frozenset({"COMPLETED", "PARTIAL", "REFUNDED"})
+
+_BASE_HEADERS = MappingProxyType({"Accept": "application/json"})
+
 # ── Configuration ───────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=1)
+def _env_defaults() -> dict[str, str]:
+    """
+    ``LIFI_*`` env settings, read once on first use.
+
+    Deliberately not at import time: the MCP server loads ``.env`` after
+    importing the clients.
+    """
+    return {
+        "api_url": os.getenv("LIFI_API_URL", "https://li.quest/v1"),
+        "api_key": os.getenv("LIFI_API_KEY", ""),
+        "cache_dir": os.getenv(
+            "LIFI_CACHE_DIR", os.path.expanduser("~/.cache/agent_of_sats/lifi")
+        ),
+    }
+
+
 @dataclass
 class LifiConfig:
-    api_url: str = ""
-    api_key: str = ""
+    api_url: str = field(default_factory=lambda: _env_defaults()["api_url"])
+    api_key: str = field(default_factory=lambda: _env_defaults()["api_key"])
     integrator: str = "agent-of-sats"
-
-    def __post_init__(self):
-        self.api_url = self.api_url or os.getenv(
-            "LIFI_API_URL", "https://li.quest/v1"
-        )
-        self.api_key = self.api_key or os.getenv("LIFI_API_KEY", "")
+    max_requests_per_second: float = 0.0  # 0 → 10 public, 100 with API key
+    # persisted reference-data cache ("off" to disable)
+    cache_dir: str = field(default_factory=lambda: _env_defaults()["cache_dir"])
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=256)
 def resolve_chain_id(chain: str | int) -> int:
     """Resolve a chain name or ID to a numeric chain ID."""
     if isinstance(chain, int):
@@ -105,28 +146,57 @@ def resolve_chain_id(chain: str | int) -> int:
         return CHAIN_IDS[key]
     raise ValueError(
         f"Unknown chain '{chain}'. Use a numeric chain ID or one of: "
-        f"{', '.join(sorted(CHAIN_IDS.keys()))}"
+        f"{_CHAIN_IDS_SORTED_STR}"
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def resolve_token(symbol_or_address: str, chain_id: int | None = None) -> str:
     """Resolve a token symbol or address. Symbols like 'USDC' are mapped to
     chain-specific addresses; raw 0x addresses pass through unchanged."""
-    if symbol_or_address.startswith("0x") and len(symbol_or_address) == 42:
+    if _ADDR_RE(symbol_or_address):
         return symbol_or_address
 
-    upper = symbol_or_address.upper().strip()
+    upper = symbol_or_address.strip().upper()
 
-    # Native token aliases
-    if upper in TOKEN_SYMBOLS:
-        return TOKEN_SYMBOLS[upper]
+    # Native token aliases, then chain-specific USDC; otherwise the symbol
+    # itself (Li.Fi also accepts symbol strings in the quote endpoint)
+    return (
+        TOKEN_SYMBOLS.get(upper)
+        or (USDC_ADDRESSES.get(chain_id) if upper == "USDC" and chain_id else None)
+        or upper
+    )
 
-    # USDC has chain-specific addresses
-    if upper == "USDC" and chain_id and chain_id in USDC_ADDRESSES:
-        return USDC_ADDRESSES[chain_id]
 
-    # Li.Fi also accepts symbol strings directly in the quote endpoint
-    return upper
+class LifiAPIError(httpx.HTTPStatusError):
+    """Non-2xx Li.Fi response; ``snippet`` holds the start of the body."""
+
+    def __init__(self, response: httpx.Response, snippet: str):
+        super().__init__(
+            f"Li.Fi HTTP {response.status_code}: {snippet}",
+            request=response.request,
+            response=response,
+        )
+        self.status_code = response.status_code
+        self.snippet = snippet
+
+
+def _is_param(pair: Any) -> bool:
+    """Whether *pair* is a ``[name, value]`` query parameter from the cache file."""
+    return (
+        isinstance(pair, list)
+        and len(pair) == 2
+        and isinstance(pair[0], str)
+        and isinstance(pair[1], (str, int, float, bool))
+    )
+
+
+def _is_terminal(status: dict[str, Any]) -> bool:
+    """Whether a /status answer is final (terminal status or substatus)."""
+    return (
+        status.get("status") in _TERMINAL_STATUS
+        or status.get("substatus") in _TERMINAL_SUBSTATUS
+    )
 
 
 # ── Client ──────────────────────────────────────────────────────────────────
@@ -142,21 +212,80 @@ class LifiClient:
     Set ``LIFI_API_KEY`` env var for higher limits.
     """
 
-    def __init__(self, config: LifiConfig | None = None):
+    def __init__(
+        self,
+        config: LifiConfig | None = None,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        """
+        Pass *http_client* to share one connection pool across service
+        clients.  A shared client is not closed by ``close()``, and its own
+        ``base_url``/headers are left alone: requests then use absolute
+        Li.Fi URLs and carry this client's headers explicitly.
+        """
         self.cfg = config or LifiConfig()
-        headers: dict[str, str] = {"Accept": "application/json"}
+        headers: Mapping[str, str] = _BASE_HEADERS
         if self.cfg.api_key:
-            headers["x-lifi-api-key"] = self.cfg.api_key
+            headers = {**_BASE_HEADERS, "x-lifi-api-key": self.cfg.api_key}
             logger.info("Li.Fi client initialised with API key")
         else:
             logger.info(
                 "Li.Fi client initialised (public rate limit, no API key)"
             )
-        self._http = httpx.AsyncClient(
-            base_url=self.cfg.api_url,
-            timeout=20.0,
-            headers=headers,
+        self._owns_http = http_client is None
+        if http_client is None:
+            # HTTP/2 multiplexes concurrent quote/status calls over one
+            # connection to li.quest; the pool is sized for fan-out bursts.
+            self._http = httpx.AsyncClient(
+                base_url=self.cfg.api_url,
+                timeout=20.0,
+                headers=headers,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            self._url_prefix = ""
+            self._headers: Mapping[str, str] | None = None
+        else:
+            self._http = http_client
+            self._url_prefix = self.cfg.api_url.rstrip("/")
+            self._headers = headers
+
+        # Per-client constant query params merged into every quote
+        self._base_quote_params = MappingProxyType(
+            {"integrator": self.cfg.integrator}
+        )
+
+        # Stay under Li.Fi's per-IP rate limit instead of reacting to 429s
+        rate = self.cfg.max_requests_per_second or (
+            100.0 if self.cfg.api_key else 10.0
         )
+        self._limiter = TokenBucket(rate=rate, capacity=rate)
+
+        # (method, path, params) → (fetched_at, JSON body, etag), one lock
+        # per key.  Bodies are decoded per hit so callers own their result.
+        # Entries with an ETag are persisted to disk on close() and
+        # revalidated with If-None-Match after a restart.
+        self._cache: dict[tuple, tuple[float, bytes, str | None]] = {}
+        self._cache_locks: dict[tuple, asyncio.Lock] = {}
+        self._cache_file = (
+            None
+            if self.cfg.cache_dir.lower() in ("", "off")
+            else os.path.join(self.cfg.cache_dir, "cache.json")
+        )
+        self._disk_load: asyncio.Future | None = None
+
+        # Compact token indexes built by get_tokens_compact()
+        self._token_index: dict[tuple[int, str], tuple[str, int]] = {}
+        self._symbol_index: dict[tuple[int, str], str] = {}
+        self._compact_fetched: dict[str, float] = {}
+
+        # In-flight uncached requests, keyed like the cache, for coalescing
+        self._inflight: dict[tuple, asyncio.Future] = {}
 
     # ─── 1. GET /quote — Primary endpoint ───────────────────────────────
 
@@ -192,23 +321,49 @@ class LifiClient:
         fc = resolve_chain_id(from_chain)
         tc = resolve_chain_id(to_chain)
 
+        if type(from_amount) is not str:
+            from_amount = str(from_amount)
+
         params: dict[str, Any] = {
+            **self._base_quote_params,
             "fromChain": fc,
             "toChain": tc,
-            "fromToken": resolve_token(from_token, fc),
-            "toToken": resolve_token(to_token, tc),
-            "fromAmount": str(from_amount),
+            "fromToken": self._resolve_token(from_token, fc),
+            "toToken": self._resolve_token(to_token, tc),
+            "fromAmount": from_amount,
             "fromAddress": from_address,
             "slippage": slippage,
-            "integrator": self.cfg.integrator,
         }
         if allow_bridges:
             params["allowBridges"] = ",".join(allow_bridges)
         if deny_bridges:
             params["denyBridges"] = ",".join(deny_bridges)
 
-        resp = await self._request("GET", "/quote", params=params)
-        return resp
+        return await self._coalesced_request("GET", "/quote", params)
+
+    async def get_quotes_batch(
+        self,
+        requests: list[dict[str, Any]],
+        concurrency: int = 20,
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Fetch many quotes concurrently.
+
+        Each entry of *requests* holds ``get_quote`` keyword arguments.
+        At most *concurrency* quotes are in flight at once (the rate
+        limiter still applies).  Results come back in request order; a
+        failed quote is returned as its exception instead of aborting the
+        batch.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(req: dict[str, Any]) -> dict[str, Any]:
+            async with sem:
+                return await self.get_quote(**req)
+
+        return await asyncio.gather(
+            *(one(r) for r in requests), return_exceptions=True
+        )
 
     # ─── 2. POST /advanced/routes — Multiple route options ──────────────
 
@@ -233,8 +388,8 @@ class LifiClient:
         body = {
             "fromChainId": fc,
             "toChainId": tc,
-            "fromTokenAddress": resolve_token(from_token, fc),
-            "toTokenAddress": resolve_token(to_token, tc),
+            "fromTokenAddress": self._resolve_token(from_token, fc),
+            "toTokenAddress": self._resolve_token(to_token, tc),
             "fromAmount": str(from_amount),
             "fromAddress": from_address,
             "options": {
@@ -283,12 +438,19 @@ class LifiClient:
         bridge: str | None = None,
         from_chain: str | int | None = None,
         to_chain: str | int | None = None,
-        interval: float = 15.0,
-        max_polls: int = 40,
+        interval: float = 5.0,
+        max_polls: int = 15,
+        max_interval: float = 60.0,
     ) -> dict[str, Any]:
         """
         Poll transfer status until terminal state (DONE or FAILED).
 
+        The delay starts at *interval* and grows 1.5× per poll up to
+        *max_interval* (±20% jitter), so fast bridges are caught early and
+        slow ones are not hammered; the defaults span about ten minutes.
+        A terminal substatus (COMPLETED / PARTIAL / REFUNDED) also ends
+        polling.
+
         Returns the final status dict. Raises TimeoutError if max_polls exceeded.
         """
         for i in range(max_polls):
@@ -298,30 +460,80 @@ class LifiClient:
                 "Li.Fi status poll %d/%d for %s: %s",
                 i + 1, max_polls, tx_hash[:10], state,
             )
-            if state in ("DONE", "FAILED"):
+            if _is_terminal(status):
                 return status
-            await asyncio.sleep(interval)
+            delay = min(max_interval, interval * 1.5**i)
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
 
         raise TimeoutError(
             f"Transfer {tx_hash} still {state} after {max_polls} polls"
         )
 
+    async def poll_many_statuses(
+        self,
+        txs: list[dict[str, Any]],
+        interval: float = 15.0,
+        max_polls: int = 40,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Poll several transfers together until each reaches a terminal state.
+
+        Each entry of *txs* holds ``get_status`` keyword arguments
+        (``tx_hash`` plus optional ``bridge`` / ``from_chain`` /
+        ``to_chain``).  Every tick queries all pending transfers
+        concurrently and yields ``(tx_hash, status)`` as soon as a transfer
+        finishes; the same states as ``poll_status`` (DONE / FAILED, or a
+        terminal substatus) count as finished.  Errors on a single transfer
+        are logged and retried on the next tick.  Raises TimeoutError if any
+        are still pending after *max_polls* ticks.
+        """
+        pending = {tx["tx_hash"]: tx for tx in txs}
+        for i in range(max_polls):
+            results = await asyncio.gather(
+                *(self.get_status(**tx) for tx in pending.values()),
+                return_exceptions=True,
+            )
+            for tx_hash, status in zip(list(pending), results):
+                if isinstance(status, BaseException):
+                    logger.warning(
+                        "Li.Fi status poll %d/%d for %s failed: %s",
+                        i + 1, max_polls, tx_hash[:10], status,
+                    )
+                    continue
+                if _is_terminal(status):
+                    del pending[tx_hash]
+                    yield tx_hash, status
+            if not pending:
+                return
+            logger.info(
+                "Li.Fi status poll %d/%d: %d transfer(s) pending",
+                i + 1, max_polls, len(pending),
+            )
+            await asyncio.sleep(interval)
+
+        raise TimeoutError(
+            f"Transfers still pending after {max_polls} polls: "
+            f"{', '.join(pending)}"
+        )
+
     # ─── 4. GET /chains — List supported chains ────────────────────────
 
     async def get_chains(
-        self, chain_types: str = "EVM"
+        self, chain_types: str = "EVM", refresh: bool = False
     ) -> dict[str, Any]:
         """
         List all supported chains.
 
         Parameters:
             chain_types – filter by type: "EVM", "SVM" (Solana), "UTXO" (Bitcoin)
+            refresh     – revalidate with the API even if the cache is fresh
         """
         params: dict[str, Any] = {}
         if chain_types:
             params["chainTypes"] = chain_types
-        resp = await self._request("GET", "/chains", params=params)
-        return resp
+        return await self._cached_request(
+            "GET", "/chains", params=params, ttl=0 if refresh else REFERENCE_TTL_S
+        )
 
     # ─── 5. GET /tokens — List supported tokens ────────────────────────
 
@@ -337,19 +549,59 @@ class LifiClient:
         if chains:
             chain_ids = [str(resolve_chain_id(c)) for c in chains]
             params["chains"] = ",".join(chain_ids)
-        resp = await self._request("GET", "/tokens", params=params)
-        return resp
+        return await self._cached_request(
+            "GET", "/tokens", params=params, ttl=REFERENCE_TTL_S
+        )
+
+    async def get_tokens_compact(
+        self, chains: list[int | str] | None = None
+    ) -> dict[tuple[int, str], tuple[str, int]]:
+        """
+        Token list projected to ``(chainId, address) → (symbol, decimals)``.
+
+        Parses ``/tokens`` once without keeping the full response (logos,
+        prices, names…).  Also fills a ``(chainId, SYMBOL) → address`` index
+        that quote/route calls use to resolve any listed symbol, with the
+        static ``USDC_ADDRESSES`` table as fallback.  Addresses in the
+        returned keys are lower-cased; refetched at most every
+        ``REFERENCE_TTL_S`` per chain filter.
+        """
+        params: dict[str, Any] = {}
+        if chains:
+            params["chains"] = ",".join(str(resolve_chain_id(c)) for c in chains)
+        key = params.get("chains", "")
+        fetched = self._compact_fetched.get(key)
+        if fetched is None or time.monotonic() - fetched >= REFERENCE_TTL_S:
+            resp = await self._request("GET", "/tokens", params=params)
+            token_index = self._token_index
+            symbol_index = self._symbol_index
+            for chain_id, tokens in resp.get("tokens", {}).items():
+                cid = int(chain_id)
+                for t in tokens:
+                    address, symbol = t.get("address"), t.get("symbol")
+                    if not address or not symbol:
+                        continue
+                    token_index[(cid, address.lower())] = (
+                        symbol,
+                        int(t.get("decimals", 0)),
+                    )
+                    # Li.Fi lists the canonical token first for a symbol
+                    symbol_index.setdefault((cid, symbol.upper()), address)
+            self._compact_fetched[key] = time.monotonic()
+        return self._token_index
 
     # ─── 6. GET /tools — List bridges and DEXs ─────────────────────────
 
-    async def get_tools(self) -> dict[str, Any]:
+    async def get_tools(self, refresh: bool = False) -> dict[str, Any]:
         """
         List available bridges and exchanges.
 
-        Returns ``{bridges: [...], exchanges: [...]}``.
+        Returns ``{bridges: [...], exchanges: [...]}``.  ``refresh``
+        revalidates with the API even if the cache is fresh.
         """
-        resp = await self._request("GET", "/tools")
-        return resp
+        return await self._cached_request(
+            "GET", "/tools", ttl=0 if refresh else REFERENCE_TTL_S
+        )
 
     # ─── 7. GET /connections — Possible transfer connections ────────────
 
@@ -363,47 +615,195 @@ class LifiClient:
         """
         Get possible token transfer connections between chains.
         """
+        fc = resolve_chain_id(from_chain) if from_chain else None
+        tc = resolve_chain_id(to_chain) if to_chain else None
+
         params: dict[str, Any] = {}
-        if from_chain:
-            params["fromChain"] = resolve_chain_id(from_chain)
-        if to_chain:
-            params["toChain"] = resolve_chain_id(to_chain)
+        if fc is not None:
+            params["fromChain"] = fc
+        if tc is not None:
+            params["toChain"] = tc
         if from_token:
-            fc = resolve_chain_id(from_chain) if from_chain else None
-            params["fromToken"] = resolve_token(from_token, fc)
+            params["fromToken"] = self._resolve_token(from_token, fc)
         if to_token:
-            tc = resolve_chain_id(to_chain) if to_chain else None
-            params["toToken"] = resolve_token(to_token, tc)
-        resp = await self._request("GET", "/connections", params=params)
-        return resp
+            params["toToken"] = self._resolve_token(to_token, tc)
+        return await self._cached_request(
+            "GET", "/connections", params=params, ttl=REFERENCE_TTL_S
+        )
 
     # ─── 8. GET /gas — Gas prices and suggestions ──────────────────────
 
     async def get_gas_prices(self) -> dict[str, Any]:
         """Get current gas prices for all supported chains."""
-        return await self._request("GET", "/gas/prices")
+        return await self._cached_request("GET", "/gas/prices", ttl=GAS_TTL_S)
 
     async def get_gas_suggestion(self, chain: str | int) -> dict[str, Any]:
         """Get gas suggestion for a specific chain."""
         cid = resolve_chain_id(chain)
-        return await self._request("GET", f"/gas/suggestion/{cid}")
+        return await self._cached_request(
+            "GET", f"/gas/suggestion/{cid}", ttl=GAS_TTL_S
+        )
 
     # ─── Connectivity check ─────────────────────────────────────────────
 
     async def is_connected(self) -> bool:
-        """Quick health check – can we reach Li.Fi?"""
+        """
+        Quick health check – can we reach Li.Fi?
+
+        Sends a bodiless ``HEAD`` request; any non-5xx answer (including 405)
+        means the API is up, so nothing is downloaded or parsed.
+        """
         try:
-            resp = await self._http.get("/chains", params={"chainTypes": "EVM"})
-            return resp.status_code == 200
+            await self._limiter.acquire()
+            resp = await self._http.head(
+                self._url_prefix + "/chains", headers=self._headers
+            )
+            return resp.status_code < 500
         except Exception:
             return False
 
     # ─── Cleanup ────────────────────────────────────────────────────────
 
     async def close(self) -> None:
-        await self._http.aclose()
+        global _default_client
+        if _default_client is self:
+            _default_client = None
+        if self._cache_file:
+            await asyncio.to_thread(self._save_disk_cache)
+        if self._owns_http:
+            await self._http.aclose()
 
-    # ─── Internal request helper ────────────────────────────────────────
+    # ─── Internal request helpers ───────────────────────────────────────
+
+    async def _cached_request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        ttl: float = REFERENCE_TTL_S,
+    ) -> Any:
+        """
+        ``_request`` with an in-memory TTL cache for reference data.
+
+        Concurrent misses on the same key wait on one lock, so only the
+        first caller goes to the network.  Expired entries that carry an
+        ETag are revalidated with a conditional GET; a 304 reuses the
+        cached body without transferring it.  Every call returns a freshly
+        decoded object, so callers may reshape it without touching the
+        cache.
+        """
+        if self._cache_file and self._disk_load is None:
+            self._disk_load = asyncio.ensure_future(
+                asyncio.to_thread(self._load_disk_cache)
+            )
+        if self._disk_load is not None:
+            try:
+                await self._disk_load
+            except Exception as exc:
+                # Carry on with an empty cache; a failed load is not kept.
+                logger.warning("Li.Fi cache load failed: %s", exc)
+                self._disk_load = None
+
+        key = (method, path, tuple(sorted((params or {}).items())))
+        hit = self._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return orjson.loads(hit[1])
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return orjson.loads(hit[1])
+            etag = hit[2] if hit is not None else None
+            resp = await self._send(
+                method,
+                path,
+                params=params,
+                headers={"If-None-Match": etag} if etag else None,
+            )
+            if resp.status_code == 304 and hit is not None:
+                body = hit[1]
+            else:
+                body = resp.content
+                etag = resp.headers.get("ETag")
+            payload = orjson.loads(body)
+            self._cache[key] = (time.monotonic(), body, etag)
+            return payload
+
+    def _resolve_token(self, token: str, chain_id: int | None) -> str:
+        """``resolve_token``, preferring symbols learned from the token list."""
+        if chain_id is not None and self._symbol_index:
+            address = self._symbol_index.get((chain_id, token.strip().upper()))
+            if address:
+                return address
+        return resolve_token(token, chain_id)
+
+    async def _coalesced_request(
+        self, method: str, path: str, params: dict[str, Any]
+    ) -> Any:
+        """
+        ``_request`` that shares one in-flight call between identical
+        concurrent requests (e.g. several strategies quoting the same pair).
+        """
+        key = (method, path, tuple(sorted(params.items())))
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._request(method, path, params=params))
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _f: self._inflight.pop(key, None))
+        # shield: one caller being cancelled must not cancel the others
+        return await asyncio.shield(fut)
+
+    def _load_disk_cache(self) -> None:
+        """
+        Seed the cache from disk; loaded entries start out expired.
+
+        A file that cannot be read or does not have the layout written by
+        ``_save_disk_cache`` is ignored as a whole.
+        """
+        path = self._cache_file
+        if not path:
+            return
+        try:
+            with open(path, "rb") as fh:
+                entries = orjson.loads(fh.read())
+            loaded = {}
+            for method, url_path, params, etag, payload in entries:
+                if not (
+                    isinstance(method, str)
+                    and isinstance(url_path, str)
+                    and isinstance(etag, str)
+                    and isinstance(params, list)
+                    and all(_is_param(p) for p in params)
+                ):
+                    raise ValueError(f"malformed entry for {url_path!r}")
+                key = (method, url_path, tuple((k, v) for k, v in params))
+                loaded[key] = (float("-inf"), orjson.dumps(payload), etag)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning("Ignoring unreadable Li.Fi cache: %s", exc)
+            return
+        for key, entry in loaded.items():
+            self._cache.setdefault(key, entry)
+
+    def _save_disk_cache(self) -> None:
+        """Write ETag-bearing cache entries to disk atomically."""
+        entries = [
+            [method, path, params, etag, orjson.loads(body)]
+            for (method, path, params), (_, body, etag) in self._cache.items()
+            if etag
+        ]
+        path = self._cache_file
+        if not path or not entries:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(orjson.dumps(entries))
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning("Could not persist Li.Fi cache: %s", exc)
 
     async def _request(
         self,
@@ -412,31 +812,83 @@ class LifiClient:
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
+        """Make a request to the Li.Fi API and decode the JSON body."""
+        resp = await self._send(method, path, params=params, json=json)
+        return orjson.loads(resp.content)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
         """
-        Make a request to the Li.Fi API with error handling.
+        Send a request to the Li.Fi API with error handling.
+
+        Every attempt waits for a rate-limiter token.  A 304 is returned
+        as-is for the caller's conditional-GET handling.
 
         Handles:
-            - 429 rate limit → log warning
-            - 4xx/5xx → raise with detail
+            - 429 rate limit → sleep for Retry-After (or 1, 2, 4 s; at most
+              MAX_RETRY_AFTER_S) and retry
+            - 4xx/5xx → raise LifiAPIError with the start of the body
         """
-        try:
-            resp = await self._http.request(
-                method, path, params=params, json=json
-            )
-            if resp.status_code == 429:
-                logger.warning(
-                    "Li.Fi rate limit hit on %s %s — back off and retry",
-                    method, path,
+        if self._headers is not None:
+            headers = {**self._headers, **headers} if headers else self._headers
+        for attempt in range(MAX_ATTEMPTS):
+            await self._limiter.acquire()
+            try:
+                resp = await self._http.request(
+                    method,
+                    self._url_prefix + path,
+                    params=params,
+                    json=json,
+                    headers=headers,
                 )
-            resp.raise_for_status()
-            return resp.json()
-        except httpx.HTTPStatusError as exc:
-            body = exc.response.text[:500]
-            logger.error(
-                "Li.Fi %s %s → HTTP %s: %s",
-                method, path, exc.response.status_code, body,
-            )
-            raise
-        except Exception as exc:
-            logger.error("Li.Fi %s %s failed: %s", method, path, exc)
-            raise
+                logger.debug(
+                    "Li.Fi %s %s → %s over %s",
+                    method, path, resp.status_code, resp.http_version,
+                )
+                if resp.status_code == 429 and attempt < MAX_ATTEMPTS - 1:
+                    delay = retry_after_s(resp, 2.0**attempt)
+                    logger.warning(
+                        "Li.Fi rate limit hit on %s %s — retrying in %.1fs",
+                        method, path, delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                if resp.is_success or resp.status_code == 304:
+                    return resp
+                # Decode only the head of the body (error pages can be large)
+                snippet = resp.content[:500].decode("utf-8", "replace")
+                logger.error(
+                    "Li.Fi %s %s → HTTP %s: %s",
+                    method, path, resp.status_code, snippet,
+                )
+                raise LifiAPIError(resp, snippet)
+            except LifiAPIError:
+                raise
+            except Exception as exc:
+                logger.error("Li.Fi %s %s failed: %s", method, path, exc)
+                raise
+
+
+# ── Shared instance ─────────────────────────────────────────────────────────
+
+_default_client: LifiClient | None = None
+
+
+def get_default_client() -> LifiClient:
+    """
+    Process-wide ``LifiClient`` built from env config.
+
+    Call sites that share it share one connection pool, rate limiter and
+    cache instead of each opening their own.  Closing it resets the
+    singleton.
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = LifiClient()
+    return _default_client
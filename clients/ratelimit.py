@@ -0,0 +1,107 @@
+"""
+Client-side rate limiting shared by the external service clients.
+
+A token bucket smooths bursts (e.g. closing several positions, polling
+loops) below the upstream API's limit so requests are not rejected with
+HTTP 429 and pushed into server-side backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+DAY_S = 86_400.0
+
+# Longest server-requested back-off honoured before a retry; a longer wait
+# would stall the tool call that is waiting on the response.
+MAX_RETRY_AFTER_S = 30.0
+
+
+def retry_after_s(resp: httpx.Response, default: float) -> float:
+    """
+    Seconds to wait before retrying *resp*: a numeric ``Retry-After``
+    header, else *default*, clamped to ``[0, MAX_RETRY_AFTER_S]``.
+    Missing, malformed and non-finite headers fall back to *default*.
+    """
+    value = resp.headers.get("Retry-After")
+    try:
+        delay = default if value is None else float(value)
+    except ValueError:
+        delay = default
+    if not math.isfinite(delay):
+        delay = default
+    return min(MAX_RETRY_AFTER_S, max(0.0, delay))
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket.
+
+    ``rate`` tokens are added per second up to ``capacity``; ``acquire``
+    waits until a token is available.  Waiters are served in FIFO order.
+
+    ``daily_cap`` optionally bounds the number of grants in any rolling
+    24 h window on top of the steady rate.
+    """
+
+    def __init__(self, rate: float, capacity: float, daily_cap: int | None = None):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.daily_cap = daily_cap
+        self._tokens = capacity
+        self._ts = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._grants: deque[float] = deque()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._ts) * self.rate)
+        self._ts = now
+        while self._grants and now - self._grants[0] >= DAY_S:
+            self._grants.popleft()
+
+    def _wait_s(self, tokens: float) -> float:
+        """Seconds until ``tokens`` could be granted (0 if available now)."""
+        wait = max(0.0, (tokens - self._tokens) / self.rate)
+        if self.daily_cap is not None and len(self._grants) >= self.daily_cap:
+            wait = max(wait, self._grants[0] + DAY_S - self._ts)
+        return wait
+
+    def _take(self, tokens: float) -> None:
+        self._tokens -= tokens
+        if self.daily_cap is not None:
+            self._grants.append(self._ts)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Consume ``tokens`` if available right now; never waits."""
+        if self._lock.locked():
+            return False
+        self._refill()
+        if self._wait_s(tokens) > 0:
+            return False
+        self._take(tokens)
+        return True
+
+    def release(self, tokens: float = 1.0) -> None:
+        """Return ``tokens`` taken for a request that was never completed."""
+        self._tokens = min(self.capacity, self._tokens + tokens)
+        if self.daily_cap is not None and self._grants:
+            self._grants.pop()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available, then consume them."""
+        async with self._lock:
+            self._refill()
+            while (wait := self._wait_s(tokens)) > 0:
+                await asyncio.sleep(wait)
+                self._refill()
+            self._take(tokens)
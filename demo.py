@@ -7,13 +7,18 @@ simulating the Cursor/Claude Desktop flow for a recording.
 
 Usage:
     source .venv/bin/activate
-    python demo.py
+    python demo.py                   # live, paced for recording
+    python demo.py --mock --no-pause # CI/smoke run
+
+``--mock`` clears the signing keys (Moltbook runs in mock mode, Hyperliquid
+cannot trade) and fetches the independent read-only scenes concurrently.
+``--no-pause`` skips the narration pauses.  ``DEMO_FAST=1`` implies both.
 """
 
 from __future__ import annotations
 
+import argparse
 import asyncio
-import json
 import os
 import sys
 import time
@@ -21,10 +26,19 @@ import time
 # ensure project root is on path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
+DEMO_FAST = os.getenv("DEMO_FAST", "0") == "1"
+# Per-host cap for concurrent calls in fast mode (browser-style limit).
+FAST_CONCURRENCY = 6
+
+# Overridden from the command line in __main__.
+MOCK = DEMO_FAST
+PAUSES = not DEMO_FAST
+
 # ── formatting helpers ──────────────────────────────────────────────────────
 
 CYAN = "\033[96m"
@@ -36,24 +50,25 @@ DIM = "\033[2m"
 RESET = "\033[0m"
 
 
+def emit(lines: list[str]):
+    """Write a block of lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def banner(title: str, icon: str = "▸"):
-    width = 64
-    print()
-    print(f"{CYAN}{'━' * width}{RESET}")
-    print(f"{CYAN}{BOLD}  {icon}  {title}{RESET}")
-    print(f"{CYAN}{'━' * width}{RESET}")
-    print()
+    rule = f"{CYAN}{'━' * 64}{RESET}"
+    emit(["", rule, f"{CYAN}{BOLD}  {icon}  {title}{RESET}", rule, ""])
 
 
 def step(label: str):
     print(f"  {DIM}→ {label}...{RESET}")
 
 
-def result_json(data: dict, indent: int = 2):
-    formatted = json.dumps(data, indent=indent, default=str)
-    for line in formatted.split("\n"):
-        print(f"  {GREEN}{line}{RESET}")
-    print()
+def result_json(data: dict):
+    formatted = orjson.dumps(
+        data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
+    emit([f"  {GREEN}{line}{RESET}" for line in formatted.split("\n")] + [""])
 
 
 def narrate(text: str):
@@ -62,34 +77,77 @@ def narrate(text: str):
 
 
 def pause(seconds: float = 1.5):
-    time.sleep(seconds)
+    if PAUSES:
+        time.sleep(seconds)
+
+
+async def gather_limited(*aws, limit: int = FAST_CONCURRENCY):
+    """Run awaitables in a TaskGroup with at most ``limit`` in flight."""
+    sem = asyncio.Semaphore(limit)
+
+    async def _one(aw):
+        async with sem:
+            return await aw
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_one(aw)) for aw in aws]
+    return [t.result() for t in tasks]
 
 
 # ── demo flow ───────────────────────────────────────────────────────────────
 
 
+async def _demo_quote(wallet: str | None) -> dict:
+    from mcp_server import server
+
+    return await server.lifi_get_quote(
+        from_chain="ethereum",
+        to_chain="arbitrum",
+        from_token="USDC",
+        to_token="USDC",
+        from_amount="10000000",  # 10 USDC
+        from_address=wallet,
+    )
+
+
 async def run_demo():
     from mcp_server.server import mcp, app_lifespan
     from mcp_server import server
 
     async with app_lifespan(mcp):
-        print()
-        print(f"{MAGENTA}{BOLD}")
-        print("  ╔══════════════════════════════════════════════════════╗")
-        print("  ║          AGENT OF SATS — LIVE DEMO                  ║")
-        print("  ║   BTC-native strategy engine • MCP server           ║")
-        print("  ║   Hyperliquid • ERC-8004 • Li.Fi • Moltbook         ║")
-        print("  ╚══════════════════════════════════════════════════════╝")
-        print(f"{RESET}")
+        emit([
+            "",
+            f"{MAGENTA}{BOLD}",
+            "  ╔══════════════════════════════════════════════════════╗",
+            "  ║          AGENT OF SATS — LIVE DEMO                  ║",
+            "  ║   BTC-native strategy engine • MCP server           ║",
+            "  ║   Hyperliquid • ERC-8004 • Li.Fi • Moltbook         ║",
+            "  ╚══════════════════════════════════════════════════════╝",
+            f"{RESET}",
+        ])
         pause(2)
 
+        # Scenes 1, 2, 4 and 6 don't depend on each other; in mock mode
+        # fetch them in one round so the read phase costs max-of-RTTs, not
+        # sum-of-RTTs.  Scenes 3 and 5 write state, and scene 7 reads the log
+        # they produce, so those stay sequential.
+        if MOCK:
+            assert server.hl_client
+            status, snapshot, quote, erc = await gather_limited(
+                server.get_status(),
+                server.get_pnl_snapshot(),
+                _demo_quote(server.hl_client.cfg.wallet_address or None),
+                server.get_erc8004_registration(),
+            )
+
         # ── 1. get_status ───────────────────────────────────────────
         banner("Scene 1: Health Check", "🔌")
         narrate("Checking MCP server status and Hyperliquid connectivity...")
         step("Calling get_status()")
         pause()
 
-        status = await server.get_status()
+        if not MOCK:
+            status = await server.get_status()
         result_json(status)
 
         narrate(
@@ -104,7 +162,8 @@ async def run_demo():
         step("Calling get_pnl_snapshot(window_24h=True, window_7d=True)")
         pause()
 
-        snapshot = await server.get_pnl_snapshot()
+        if not MOCK:
+            snapshot = await server.get_pnl_snapshot()
 
         # Show account summary separately for clarity
         print(f"  {GREEN}{BOLD}Account Summary:{RESET}")
@@ -175,15 +234,9 @@ async def run_demo():
         step("Calling lifi_get_quote(from_chain='ethereum', to_chain='arbitrum', from_amount='10000000')")
         pause()
 
-        wallet = status.get("hyperliquid_address", "0x7623f00fa06A6Cf6fD084F99925557ad5416Ff01")
-        quote = await server.lifi_get_quote(
-            from_chain="ethereum",
-            to_chain="arbitrum",
-            from_token="USDC",
-            to_token="USDC",
-            from_amount="10000000",  # 10 USDC
-            from_address=wallet,
-        )
+        if not MOCK:
+            wallet = status.get("hyperliquid_address", "0x7623f00fa06A6Cf6fD084F99925557ad5416Ff01")
+            quote = await _demo_quote(wallet)
 
         if quote.get("action") == "quote_received":
             print(f"  {GREEN}{BOLD}Bridge Quote:{RESET}")
@@ -239,7 +292,8 @@ async def run_demo():
         step("Calling get_erc8004_registration()")
         pause()
 
-        erc = await server.get_erc8004_registration()
+        if not MOCK:
+            erc = await server.get_erc8004_registration()
 
         print(f"  {GREEN}{BOLD}ERC-8004 Metadata:{RESET}")
         result_json(erc["metadata"])
@@ -257,42 +311,69 @@ async def run_demo():
         pause()
 
         from mcp_server.server import perf_log as _log
+        from store.performance_log import iso_utc
+
         assert _log
-        events = await _log.iter_events(limit=10)
+        events = await _log.fetch_events(limit=10)
 
         print(f"  {GREEN}{BOLD}Last {len(events)} log events:{RESET}")
         for e in events:
-            ts = e.get("iso", e.get("ts", ""))[:19]
+            ts = iso_utc(e["ts"])[:19]
             etype = e.get("type", "unknown")
             print(f"  {GREEN}  [{ts}] {etype}{RESET}")
         print()
         pause(2)
 
         # ── Outro ───────────────────────────────────────────────────
-        print()
-        print(f"{MAGENTA}{BOLD}")
-        print("  ╔══════════════════════════════════════════════════════╗")
-        print("  ║                    DEMO COMPLETE                    ║")
-        print("  ╠══════════════════════════════════════════════════════╣")
-        print("  ║                                                      ║")
-        print("  ║  Hyperliquid   Live BTC perps on mainnet            ║")
-        print("  ║  Li.Fi         Cross-chain routing across 30+ EVM   ║")
-        print("  ║  Moltbook AI   Social reputation via EIP-191 auth   ║")
-        print("  ║  ERC-8004      On-chain identity + reputation       ║")
-        print("  ║  MCP           11 tools, any AI agent can call      ║")
-        print("  ║                                                      ║")
-        print("  ║  github.com/Vib-UX/Agent-of-Sats                   ║")
-        print("  ╚══════════════════════════════════════════════════════╝")
-        print(f"{RESET}")
+        emit([
+            "",
+            f"{MAGENTA}{BOLD}",
+            "  ╔══════════════════════════════════════════════════════╗",
+            "  ║                    DEMO COMPLETE                    ║",
+            "  ╠══════════════════════════════════════════════════════╣",
+            "  ║                                                      ║",
+            "  ║  Hyperliquid   Live BTC perps on mainnet            ║",
+            "  ║  Li.Fi         Cross-chain routing across 30+ EVM   ║",
+            "  ║  Moltbook AI   Social reputation via EIP-191 auth   ║",
+            "  ║  ERC-8004      On-chain identity + reputation       ║",
+            "  ║  MCP           11 tools, any AI agent can call      ║",
+            "  ║                                                      ║",
+            "  ║  github.com/Vib-UX/Agent-of-Sats                   ║",
+            "  ╚══════════════════════════════════════════════════════╝",
+            f"{RESET}",
+        ])
 
 
 # ── cleanup ─────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Agent of Sats live demo")
+    parser.add_argument(
+        "--mock",
+        action="store_true",
+        default=DEMO_FAST,
+        help="no signing keys; run independent scenes concurrently",
+    )
+    parser.add_argument(
+        "--no-pause",
+        action="store_true",
+        default=DEMO_FAST,
+        help="skip narration pauses",
+    )
+    args = parser.parse_args()
+    MOCK = args.mock
+    PAUSES = not args.no_pause
+    if MOCK:
+        # Clients read these at construction; blank keys force mock / read-only.
+        os.environ["MOLTBOOK_AGENT_PRIVATE_KEY"] = ""
+        os.environ["HYPERLIQUID_PRIVATE_KEY"] = ""
+
     # clean up test DB after demo
     db_path = os.getenv("PERFORMANCE_LOG_DB", "data/performance_log.db")
     try:
         asyncio.run(run_demo())
     finally:
-        if os.path.exists(db_path):
-            os.remove(db_path)
+        try:
+            os.unlink(db_path)
+        except FileNotFoundError:
+            pass
@@ -8,10 +8,12 @@ of the Solidity interface for an AgentReputationRegistry.
 
 from __future__ import annotations
 
-import json
+import functools
 import os
 from typing import Any
 
+import orjson
+
 
 def generate_agent_metadata(
     mcp_endpoint: str | None = None,
@@ -24,7 +26,25 @@ def generate_agent_metadata(
     Build the ERC‑8004 agent registration JSON.
 
     The returned dict is suitable for JSON-serialisation, IPFS pinning,
-    and passing to the ``registerAgent(tokenURI)`` contract call.
+    and passing to the ``registerAgent(tokenURI)`` contract call.  Each
+    call returns a fresh copy, so callers may mutate it freely.
+    """
+    return orjson.loads(
+        _metadata_bytes(mcp_endpoint, moltbook_profile, log_url, btc_pubkey, image_uri)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _metadata_bytes(
+    mcp_endpoint: str | None,
+    moltbook_profile: str | None,
+    log_url: str | None,
+    btc_pubkey: str | None,
+    image_uri: str,
+) -> bytes:
+    """
+    Encoded metadata per argument set.  Env defaults are read on the first
+    call and then fixed for the life of the process.
     """
     mcp_endpoint = mcp_endpoint or os.getenv(
         "ERC8004_MCP_ENDPOINT",
@@ -36,7 +56,7 @@ def generate_agent_metadata(
     log_url = log_url or "hyper://TODO-or-http://log-endpoint"
     btc_pubkey = btc_pubkey or os.getenv("ERC8004_BTC_PUBKEY", "TODO_BTC_PUBKEY")
 
-    return {
+    return orjson.dumps({
         "name": "Agent of Sats",
         "description": (
             "ERC‑8004 BTC yield agent using Hyperliquid perps "
@@ -60,12 +80,15 @@ def generate_agent_metadata(
         "externalKeys": {
             "btc_pubkey": btc_pubkey,
         },
-    }
+    })
 
 
+@functools.lru_cache(maxsize=32)
 def agent_metadata_json(**kwargs: Any) -> str:
     """Return the registration metadata as a pretty-printed JSON string."""
-    return json.dumps(generate_agent_metadata(**kwargs), indent=2)
+    return orjson.dumps(
+        generate_agent_metadata(**kwargs), option=orjson.OPT_INDENT_2
+    ).decode()
 
 
 # ── Solidity interface sketch ───────────────────────────────────────────────
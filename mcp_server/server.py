@@ -18,20 +18,23 @@ Or configure as an MCP server in Claude Desktop / any MCP-capable client.
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import logging
+import math
 import os
 import sys
 import time
-from contextlib import asynccontextmanager
+from contextlib import aclosing, asynccontextmanager
+from operator import attrgetter, methodcaller
 from typing import Any, AsyncIterator
 
+import orjson
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
 # ── local imports ───────────────────────────────────────────────────────────
 from clients.hyperliquid_client import HyperliquidPerpsClient, HyperliquidConfig
-from clients.lifi_client import LifiClient
+from clients.lifi_client import LifiClient, get_default_client
 from clients.moltbook_client import MoltbookClient
 from erc8004.registration import agent_metadata_json, generate_agent_metadata
 from store.performance_log import (
@@ -41,6 +44,7 @@ from store.performance_log import (
     EVENT_TRADE_CLOSE,
     EVENT_TRADE_OPEN,
     PerformanceLog,
+    iso_utc,
 )
 
 # ── logging (stderr only, never stdout) ────────────────────────────────────
@@ -54,7 +58,39 @@ logger = logging.getLogger("agent_of_sats.mcp")
 
 # ── load .env ───────────────────────────────────────────────────────────────
 
-load_dotenv()
+
+def _load_env() -> None:
+    """
+    Read ``.env`` into os.environ (existing variables win).  Done at startup
+    rather than import so tools can be imported without touching the
+    environment; ``AGENT_OF_SATS_NO_DOTENV=1`` skips it entirely.
+    """
+    if not os.environ.get("AGENT_OF_SATS_NO_DOTENV"):
+        load_dotenv()
+
+# ── strategy constants ──────────────────────────────────────────────────────
+
+# 8h funding rate → annualised basis points (3 periods/day × 365 × 10 000).
+FUNDING_ANNUAL_BPS_FACTOR = 3 * 365 * 10_000
+
+# Moltbook PnL post, compiled once as bound str.format methods.
+_POST_TITLE = "Agent of Sats – Weekly PnL: ${realized_7d:+,.2f}".format
+_POST_TEMPLATE = (
+    "🟠 **Agent of Sats** weekly performance update\n\n"
+    "• Cumulative PnL: **${cum_pnl:+,.2f}**\n"
+    "• 7d realized: **${realized_7d:+,.2f}**\n"
+    "• Max drawdown: **${max_dd:,.2f}**\n"
+    "• Closed trades (lifetime): **{num_trades}**\n\n"
+    "Running BTC perp basis strategy on Hyperliquid.\n"
+    "#AgentOfSats #BTC #Hyperliquid"
+).format
+
+# Summarised Li.Fi reference data served from memory for this long.
+CHAINS_TTL_S = 3600.0
+TOOLS_TTL_S = 600.0
+
+# get_status results are shared between callers polling within this window.
+STATUS_TTL_S = 1.0
 
 # ── shared state (initialised in lifespan) ──────────────────────────────────
 
@@ -64,30 +100,61 @@ moltbook: MoltbookClient | None = None
 lifi: LifiClient | None = None
 
 
+def _log_event(etype: str, payload: dict[str, Any]) -> None:
+    """
+    Queue an event for the log's background writer so log I/O stays off
+    the tool response path.  The timestamp is taken and the payload encoded
+    (once, with orjson) now, so later mutation of *payload* cannot change
+    what is persisted.
+    """
+    fut = _get_perf().append_nowait(etype, orjson.dumps(payload), time.time())
+    fut.add_done_callback(functools.partial(_log_event_done, etype))
+
+
+def _log_event_done(etype: str, fut: asyncio.Future[int]) -> None:
+    if not fut.cancelled() and (exc := fut.exception()) is not None:
+        logger.error("Failed to persist %s event", etype, exc_info=exc)
+
+
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
     """Initialise and tear down shared resources."""
     global perf_log, hl_client, moltbook, lifi
 
-    perf_log = PerformanceLog()
-    await perf_log.open()
-
-    hl_client = HyperliquidPerpsClient()
-    moltbook = MoltbookClient()
-    lifi = LifiClient()
-
-    logger.info("Agent of Sats MCP server started")
+    _load_env()
+    perf_log = hl_client = moltbook = lifi = None
+    # Everything created so far is closed below even when startup fails.
     try:
+        perf_log = PerformanceLog()
+        moltbook = MoltbookClient()
+        # Lifespan contract: Li.Fi tools share one long-lived client (HTTP/2,
+        # pooled keep-alive connections) for the whole server run;
+        # lifi.close() releases the pool and resets the shared instance.
+        lifi = get_default_client()
+        # The Hyperliquid SDK fetches exchange metadata synchronously on
+        # construction; build it in a worker thread while the log DB opens.
+        # Both are awaited to completion so neither is left half-started.
+        hl, opened = await asyncio.gather(
+            asyncio.to_thread(HyperliquidPerpsClient),
+            perf_log.open(),
+            return_exceptions=True,
+        )
+        if not isinstance(hl, BaseException):
+            hl_client = hl
+        for res in (hl, opened):
+            if isinstance(res, BaseException):
+                raise res
+
+        logger.info("Agent of Sats MCP server started")
         yield {}
     finally:
-        if perf_log:
-            await perf_log.close()
-        if hl_client:
-            await hl_client.close()
-        if moltbook:
-            await moltbook.close()
-        if lifi:
-            await lifi.close()
+        resources = [r for r in (perf_log, hl_client, moltbook, lifi) if r]
+        results = await asyncio.gather(
+            *(r.close() for r in resources), return_exceptions=True
+        )
+        for r, res in zip(resources, results):
+            if isinstance(res, BaseException):
+                logger.error("Closing %s failed: %s", type(r).__name__, res)
         logger.info("Agent of Sats MCP server stopped")
 
 
@@ -110,25 +177,111 @@ mcp = FastMCP(
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+def _get_hl() -> HyperliquidPerpsClient:
+    if hl_client is None:
+        raise RuntimeError("Hyperliquid client not initialized")
+    return hl_client
+
+
+def _get_perf() -> PerformanceLog:
+    if perf_log is None:
+        raise RuntimeError("Performance log not initialized")
+    return perf_log
+
+
+def _get_moltbook() -> MoltbookClient:
+    if moltbook is None:
+        raise RuntimeError("Moltbook client not initialized")
+    return moltbook
+
+
+def _get_lifi() -> LifiClient:
+    if lifi is None:
+        raise RuntimeError("Li.Fi client not initialized")
+    return lifi
+
+
+async def _none() -> None:
+    """Placeholder awaitable for optional legs of an ``asyncio.gather``."""
+    return None
+
+
+_get_amount_usd = methodcaller("get", "amountUSD", 0)
+
+# Position fields exposed by get_pnl_snapshot (``raw`` is deliberately left out).
+_POSITION_FIELDS = (
+    "symbol",
+    "size",
+    "entry_price",
+    "mark_price",
+    "unrealized_pnl",
+    "leverage",
+    "margin_used",
+    "liquidation_price",
+)
+_position_values = attrgetter(*_POSITION_FIELDS)
+
+
+def _sum_usd(costs: list[dict[str, Any]]) -> float:
+    """Total ``amountUSD`` over Li.Fi cost entries, iterated in C via map."""
+    return sum(map(float, map(_get_amount_usd, costs)))
+
+
+# tool name → (monotonic_ts, summarised result)
+_tool_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+def _tool_cache_get(key: str, ttl_s: float) -> dict[str, Any] | None:
+    hit = _tool_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < ttl_s:
+        return hit[1]
+    return None
+
+
+# In-flight get_status probe, shared by concurrent callers.
+_status_inflight: asyncio.Future[dict[str, Any]] | None = None
+
+
 @mcp.tool()
 async def get_status() -> dict[str, Any]:
     """
     Health check: MCP version, Hyperliquid connectivity, last PnL snapshot.
     """
-    assert hl_client and perf_log
+    global _status_inflight
+
+    if cached := _tool_cache_get("status", STATUS_TTL_S):
+        return cached
+    fut = _status_inflight
+    if fut is None:
+        fut = asyncio.ensure_future(_probe_status(_get_hl(), _get_perf()))
+        _status_inflight = fut
+        fut.add_done_callback(_clear_status_inflight)
+    # shield: one caller being cancelled must not cancel the others
+    return await asyncio.shield(fut)
+
 
-    connected = await hl_client.is_connected()
-    snapshot = await perf_log.get_latest_snapshot()
+def _clear_status_inflight(fut: asyncio.Future[dict[str, Any]]) -> None:
+    global _status_inflight
+    _status_inflight = None
+    if not fut.cancelled() and fut.exception() is None:
+        _tool_cache["status"] = (time.monotonic(), fut.result())
+
+
+async def _probe_status(
+    hl: HyperliquidPerpsClient, perf: PerformanceLog
+) -> dict[str, Any]:
+    connected = await hl.is_connected()
+    snapshot = await perf.get_latest_snapshot()
 
     return {
         "mcp_version": "1.0",
         "agent": "Agent of Sats",
         "hyperliquid_connected": connected,
-        "hyperliquid_network": hl_client.cfg.network,
-        "hyperliquid_address": hl_client.cfg.wallet_address or None,
-        "can_trade": hl_client.cfg.can_trade,
+        "hyperliquid_network": hl.cfg.network,
+        "hyperliquid_address": hl.cfg.wallet_address or None,
+        "can_trade": hl.cfg.can_trade,
         "last_pnl_snapshot_ts": snapshot["ts"] if snapshot else None,
-        "last_pnl_snapshot_iso": snapshot["iso"] if snapshot else None,
+        "last_pnl_snapshot_iso": iso_utc(snapshot["ts"]) if snapshot else None,
     }
 
 
@@ -138,24 +291,17 @@ async def get_pnl_snapshot(window_24h: bool = True, window_7d: bool = True) -> d
     Return cumulative PnL, windowed realized PnL, max drawdown, open positions,
     and account margin summary from Hyperliquid.
     """
-    assert hl_client and perf_log
-
-    summary_24h = await perf_log.compute_pnl_summary(window_hours=24) if window_24h else None
-    summary_7d = await perf_log.compute_pnl_summary(window_hours=168) if window_7d else None
+    hl = _get_hl()
+    perf = _get_perf()
 
-    account = await hl_client.get_account_summary()
+    summary_24h, summary_7d, account = await asyncio.gather(
+        perf.compute_pnl_summary(window_hours=24) if window_24h else _none(),
+        perf.compute_pnl_summary(window_hours=168) if window_7d else _none(),
+        hl.get_account_summary(),
+    )
     pos_list = [
-        {
-            "symbol": p.symbol,
-            "size": p.size,
-            "entry_price": p.entry_price,
-            "mark_price": p.mark_price,
-            "unrealized_pnl": p.unrealized_pnl,
-            "leverage": p.leverage,
-            "margin_used": p.margin_used,
-            "liquidation_price": p.liquidation_price,
-        }
-        for p in account.positions
+        dict(zip(_POSITION_FIELDS, vals))
+        for vals in map(_position_values, account.positions)
     ]
 
     result: dict[str, Any] = {
@@ -173,10 +319,7 @@ async def get_pnl_snapshot(window_24h: bool = True, window_7d: bool = True) -> d
         result["pnl_7d"] = summary_7d
 
     # Persist a snapshot event
-    await perf_log.append_event({
-        "type": EVENT_PNL_SNAPSHOT,
-        "payload": result,
-    })
+    _log_event(EVENT_PNL_SNAPSHOT, result)
 
     return result
 
@@ -199,12 +342,12 @@ async def run_basis_strategy(
         target_edge_bps  – minimum annualised funding edge in basis points.
         max_leverage     – maximum allowed leverage for the perp leg.
     """
-    assert hl_client and perf_log
+    hl = _get_hl()
 
     # 1. Fetch market data
-    market = await hl_client.get_btc_market_info()
+    market = await hl.get_btc_market_info()
     funding_8h = market.funding_rate
-    funding_annual_bps = funding_8h * 3 * 365 * 10_000  # annualised bps
+    funding_annual_bps = funding_8h * FUNDING_ANNUAL_BPS_FACTOR
 
     decision: dict[str, Any] = {
         "mark_price": market.mark_price,
@@ -225,10 +368,7 @@ async def run_basis_strategy(
             f"Funding edge ({round(funding_annual_bps, 1)} bps ann.) "
             f"does not meet target ({target_edge_bps} bps)."
         )
-        await perf_log.append_event({
-            "type": EVENT_STRATEGY_DECISION,
-            "payload": decision,
-        })
+        _log_event(EVENT_STRATEGY_DECISION, decision)
         return decision
 
     # 3. Size the position (simple: $10k notional capped by max_leverage)
@@ -238,7 +378,7 @@ async def run_basis_strategy(
 
     # 4. Place the order
     try:
-        order = await hl_client.market_open(
+        order = await hl.market_open(
             symbol="BTC",
             is_buy=is_buy,
             size=size_btc,
@@ -250,18 +390,12 @@ async def run_basis_strategy(
         decision["notional_usd"] = notional_usd
         decision["order_status"] = order.status
 
-        await perf_log.append_event({
-            "type": EVENT_TRADE_OPEN,
-            "payload": decision,
-        })
+        _log_event(EVENT_TRADE_OPEN, decision)
 
     except Exception as exc:
         decision["action"] = "error"
         decision["error"] = str(exc)
-        await perf_log.append_event({
-            "type": EVENT_ERROR,
-            "payload": decision,
-        })
+        _log_event(EVENT_ERROR, decision)
 
     return decision
 
@@ -272,17 +406,17 @@ async def close_positions(symbol: str = "BTC") -> dict[str, Any]:
     Close all open positions for a given symbol on Hyperliquid.
     Logs the closure event and realised PnL.
     """
-    assert hl_client and perf_log
+    hl = _get_hl()
 
-    positions_before = await hl_client.get_positions()
-    relevant = [p for p in positions_before if p.symbol == symbol]
+    # One pass over the book: unrealized PnL of the positions being closed.
+    pnls = [p.unrealized_pnl for p in await hl.get_positions() if p.symbol == symbol]
 
-    if not relevant:
+    if not pnls:
         return {"action": "no_positions", "symbol": symbol}
 
-    results = await hl_client.close_all_positions(symbol)
+    results = await hl.close_all_positions(symbol)
 
-    total_realized = sum(p.unrealized_pnl for p in relevant)  # approximate
+    total_realized = math.fsum(pnls)  # approximate
 
     close_event = {
         "symbol": symbol,
@@ -291,10 +425,7 @@ async def close_positions(symbol: str = "BTC") -> dict[str, Any]:
         "order_ids": [r.order_id for r in results],
     }
 
-    await perf_log.append_event({
-        "type": EVENT_TRADE_CLOSE,
-        "payload": close_event,
-    })
+    _log_event(EVENT_TRADE_CLOSE, close_event)
 
     return {
         "action": "positions_closed",
@@ -315,28 +446,25 @@ async def share_pnl_to_moltbook(
     Parameters:
         submolt_name – Moltbook submolt to post in (default: "aithoughts").
     """
-    assert moltbook and perf_log
+    mb = _get_moltbook()
+    perf = _get_perf()
 
-    summary_7d = await perf_log.compute_pnl_summary(window_hours=168)
+    summary_7d = await perf.compute_pnl_summary(window_hours=168)
 
     cum_pnl = summary_7d["cumulative_pnl_usd"]
     max_dd = summary_7d["max_drawdown_usd"]
     realized_7d = summary_7d["realized_pnl_window_usd"]
     num_trades = summary_7d["total_closed_trades"]
 
-    title = f"Agent of Sats – Weekly PnL: ${realized_7d:+,.2f}"
-
-    content = (
-        f"🟠 **Agent of Sats** weekly performance update\n\n"
-        f"• Cumulative PnL: **${cum_pnl:+,.2f}**\n"
-        f"• 7d realized: **${realized_7d:+,.2f}**\n"
-        f"• Max drawdown: **${max_dd:,.2f}**\n"
-        f"• Closed trades (lifetime): **{num_trades}**\n\n"
-        f"Running BTC perp basis strategy on Hyperliquid.\n"
-        f"#AgentOfSats #BTC #Hyperliquid"
+    title = _POST_TITLE(realized_7d=realized_7d)
+    content = _POST_TEMPLATE(
+        cum_pnl=cum_pnl,
+        realized_7d=realized_7d,
+        max_dd=max_dd,
+        num_trades=num_trades,
     )
 
-    post = await moltbook.post_pnl_update(
+    post = await mb.post_pnl_update(
         title=title,
         content=content,
         submolt_name=submolt_name,
@@ -359,6 +487,7 @@ async def lifi_get_quote(
     from_amount: str = "1000000",
     from_address: str = "0x0000000000000000000000000000000000000000",
     slippage: float = 0.005,
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """
     Get a Li.Fi cross-chain transfer quote.
@@ -374,11 +503,13 @@ async def lifi_get_quote(
         from_amount  – amount in smallest unit (e.g. "1000000" for 1 USDC)
         from_address – sender wallet address (0x...)
         slippage     – max slippage as decimal (default 0.005 = 0.5%)
+        verbose      – include the raw upstream quote (with transactionRequest)
+                       under ``full_quote``
     """
-    assert lifi
+    lf = _get_lifi()
 
     try:
-        quote = await lifi.get_quote(
+        quote = await lf.get_quote(
             from_chain=from_chain,
             to_chain=to_chain,
             from_token=from_token,
@@ -394,7 +525,7 @@ async def lifi_get_quote(
         tool_info = quote.get("tool", "")
         has_tx = "transactionRequest" in quote
 
-        return {
+        out = {
             "action": "quote_received",
             "tool_used": tool_info,
             "from": f"{action.get('fromToken', {}).get('symbol', from_token)} on {action.get('fromChainId', from_chain)}",
@@ -402,18 +533,14 @@ async def lifi_get_quote(
             "from_amount": action.get("fromAmount", from_amount),
             "to_amount": estimate.get("toAmount", "N/A"),
             "to_amount_min": estimate.get("toAmountMin", "N/A"),
-            "gas_costs_usd": sum(
-                float(g.get("amountUSD", 0))
-                for g in estimate.get("gasCosts", [])
-            ),
-            "fee_costs_usd": sum(
-                float(f.get("amountUSD", 0))
-                for f in estimate.get("feeCosts", [])
-            ),
+            "gas_costs_usd": _sum_usd(estimate.get("gasCosts", [])),
+            "fee_costs_usd": _sum_usd(estimate.get("feeCosts", [])),
             "execution_duration_s": estimate.get("executionDuration", "N/A"),
             "has_transaction_request": has_tx,
-            "full_quote": quote,
         }
+        if verbose:
+            out["full_quote"] = quote
+        return out
     except Exception as exc:
         return {
             "action": "error",
@@ -433,6 +560,7 @@ async def lifi_get_routes(
     to_token: str = "USDC",
     from_amount: str = "1000000",
     from_address: str = "0x0000000000000000000000000000000000000000",
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """
     Get multiple route options for a cross-chain transfer via Li.Fi.
@@ -440,12 +568,13 @@ async def lifi_get_routes(
     Compares different bridges and DEX paths. Useful to show users
     cost/speed tradeoffs before executing.
 
-    Parameters are the same as lifi_get_quote.
+    Parameters are the same as lifi_get_quote; ``verbose`` adds the raw
+    upstream response under ``full_result``.
     """
-    assert lifi
+    lf = _get_lifi()
 
     try:
-        result = await lifi.get_routes(
+        result = await lf.get_routes(
             from_chain=from_chain,
             to_chain=to_chain,
             from_token=from_token,
@@ -467,12 +596,14 @@ async def lifi_get_routes(
                 "tags": route.get("tags", []),
             })
 
-        return {
+        out = {
             "action": "routes_received",
             "route_count": len(routes),
             "top_routes": summaries,
-            "full_result": result,
         }
+        if verbose:
+            out["full_result"] = result
+        return out
     except Exception as exc:
         return {"action": "error", "error": str(exc)}
 
@@ -483,6 +614,7 @@ async def lifi_check_status(
     bridge: str = "",
     from_chain: str = "",
     to_chain: str = "",
+    verbose: bool = False,
 ) -> dict[str, Any]:
     """
     Check the status of a cross-chain transfer via Li.Fi.
@@ -495,73 +627,86 @@ async def lifi_check_status(
         bridge     – bridge name (optional, improves lookup speed)
         from_chain – source chain name or ID (optional)
         to_chain   – destination chain name or ID (optional)
+        verbose    – include the raw upstream status under ``full_status``
     """
-    assert lifi
+    lf = _get_lifi()
 
     try:
-        status = await lifi.get_status(
+        status = await lf.get_status(
             tx_hash=tx_hash,
             bridge=bridge or None,
             from_chain=from_chain or None,
             to_chain=to_chain or None,
         )
-        return {
+        out = {
             "status": status.get("status", "UNKNOWN"),
             "substatus": status.get("substatus"),
             "substatusMessage": status.get("substatusMessage"),
             "sending_tx": status.get("sending", {}).get("txHash"),
             "receiving_tx": status.get("receiving", {}).get("txHash"),
             "bridge_used": status.get("tool"),
-            "full_status": status,
         }
+        if verbose:
+            out["full_status"] = status
+        return out
     except Exception as exc:
         return {"action": "error", "error": str(exc)}
 
 
 @mcp.tool()
-async def lifi_get_chains() -> dict[str, Any]:
+async def lifi_get_chains(refresh: bool = False) -> dict[str, Any]:
     """
     List all EVM chains supported by Li.Fi.
 
     Returns chain IDs, names, and native tokens. Useful to discover
     valid values for lifi_get_quote's from_chain / to_chain parameters.
+    Served from a 1 h cache unless ``refresh`` is set.
     """
-    assert lifi
+    lf = _get_lifi()
 
+    if not refresh and (cached := _tool_cache_get("chains", CHAINS_TTL_S)):
+        return cached
     try:
-        result = await lifi.get_chains(chain_types="EVM")
+        result = await lf.get_chains(chain_types="EVM", refresh=refresh)
         chains = result if isinstance(result, list) else result.get("chains", result)
         summary = [
             {"id": c.get("id"), "key": c.get("key"), "name": c.get("name")}
             for c in (chains if isinstance(chains, list) else [])
         ]
-        return {
+        out = {
             "action": "chains_listed",
             "count": len(summary),
             "chains": summary,
         }
+        _tool_cache["chains"] = (time.monotonic(), out)
+        return out
     except Exception as exc:
         return {"action": "error", "error": str(exc)}
 
 
 @mcp.tool()
-async def lifi_get_tools() -> dict[str, Any]:
+async def lifi_get_tools(refresh: bool = False) -> dict[str, Any]:
     """
     List all bridges and DEX aggregators available through Li.Fi.
+    Served from a 10 min cache unless ``refresh`` is set.
     """
-    assert lifi
+    lf = _get_lifi()
 
+    if not refresh and (cached := _tool_cache_get("tools", TOOLS_TTL_S)):
+        return cached
     try:
-        result = await lifi.get_tools()
+        result = await lf.get_tools(refresh=refresh)
         bridges = result.get("bridges", [])
         exchanges = result.get("exchanges", [])
-        return {
+        out = {
             "action": "tools_listed",
             "bridge_count": len(bridges),
             "exchange_count": len(exchanges),
             "bridges": [b.get("key") for b in bridges],
             "exchanges": [e.get("key") for e in exchanges],
         }
+        _tool_cache["tools"] = (time.monotonic(), out)
+        return out
     except Exception as exc:
         return {"action": "error", "error": str(exc)}
 
@@ -600,9 +745,14 @@ async def performance_log_resource() -> str:
     Returns the last 100 events as newline-delimited JSON.
     This resource will later be backed by a Hypercore feed.
     """
-    assert perf_log
-    events = await perf_log.iter_events(limit=100)
-    return "\n".join(json.dumps(e) for e in events)
+    perf = _get_perf()
+    buf = bytearray()
+    async with aclosing(perf.iter_events(limit=100)) as events:
+        async for e in events:
+            if buf:
+                buf.append(0x0A)
+            buf += orjson.dumps(e)
+    return buf.decode()
 
 
 @mcp.resource("agent://erc8004-metadata")
@@ -618,6 +768,7 @@ async def erc8004_metadata_resource() -> str:
 
 def main():
     """Run the MCP server (stdio transport by default)."""
+    _load_env()
     mcp.run()
 
 
@@ -9,15 +9,19 @@ callers won't need to change – only the storage backend swaps.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import functools
 import logging
 import os
+import sqlite3
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, AsyncIterator
 
 import aiosqlite
+import orjson
 
 logger = logging.getLogger("agent_of_sats.store")
 
@@ -29,6 +33,135 @@ EVENT_PNL_SNAPSHOT = "pnl_snapshot"
 EVENT_STRATEGY_DECISION = "strategy_decision"
 EVENT_ERROR = "error"
 
+# ── SQL ─────────────────────────────────────────────────────────────────────
+
+# Latest in write (seq) order, matching the writer's in-memory cache; ts may
+# be caller-supplied or step backwards with the wall clock.
+_SQL_LATEST_OF_TYPE = (
+    "SELECT seq, ts, type, payload FROM events "
+    "WHERE type = ? ORDER BY seq DESC LIMIT 1"
+)
+_SQL_EVENTS_SINCE = (
+    "SELECT seq, ts, type, payload FROM events WHERE ts >= ? ORDER BY seq ASC"
+)
+# iter_events shapes, keyed by (filter by type?, limited?)
+_SQL_ITER = {
+    (False, False): "SELECT seq, ts, type, payload FROM events ORDER BY seq DESC",
+    (False, True): (
+        "SELECT seq, ts, type, payload FROM events ORDER BY seq DESC LIMIT ?"
+    ),
+    (True, False): (
+        "SELECT seq, ts, type, payload FROM events "
+        "WHERE type = ? ORDER BY seq DESC"
+    ),
+    (True, True): (
+        "SELECT seq, ts, type, payload FROM events "
+        "WHERE type = ? ORDER BY seq DESC LIMIT ?"
+    ),
+}
+_SQL_PNL_CLOSES_ASC = (
+    "SELECT ts, realized_pnl FROM events WHERE type = ? ORDER BY seq ASC"
+)
+_SQL_PNL_STATE = "SELECT cum_pnl, max_dd, total_closed FROM pnl_state WHERE id = 1"
+
+
+_SQL_INSERT_EVENT = "INSERT INTO events (ts, type, payload) VALUES (?, ?, ?)"
+# INSERT ... RETURNING needs SQLite 3.35+; older builds insert with
+# executemany and derive seqs from last_insert_rowid().
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+# Rows per multi-row INSERT: 3 parameters each, kept under the 999-variable
+# limit of SQLite builds older than 3.32.
+_INSERT_CHUNK = 999 // 3
+
+
+@functools.lru_cache(maxsize=None)
+def _sql_insert_events(n: int) -> str:
+    """Multi-row INSERT for *n* events that hands back the assigned seqs."""
+    values = ", ".join(["(?, ?, ?)"] * n)
+    return f"INSERT INTO events (ts, type, payload) VALUES {values} RETURNING seq"
+
+# ── SQLite tuning ───────────────────────────────────────────────────────────
+
+# Applied on open for file-backed logs: WAL lets reads run alongside appends
+# and, with synchronous=NORMAL, fsyncs only at checkpoints.
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",  # KiB, i.e. ~20 MB
+    "PRAGMA wal_autocheckpoint=1000",
+)
+# Page size only takes effect on a fresh file, so it is set before the
+# switch to WAL; existing logs keep theirs until a VACUUM.
+PAGE_SIZE = 8192
+# Memory-mapped reads (per connection, writer and readers alike) skip the
+# read() syscalls and pager copy on history scans.
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Read-only connections for WAL logs, so queries run beside the writer
+# instead of queueing behind it on one aiosqlite thread.
+READER_POOL_SIZE = 3
+
+# ── write batching ──────────────────────────────────────────────────────────
+
+# Appends are queued and written by one background task, many per
+# transaction.  When more events are already waiting behind the first, the
+# writer lingers briefly so the rest of the burst shares one commit; a lone
+# event, or a trade_close, is committed straight away.
+MAX_BATCH = 512
+BATCH_LINGER_S = 0.05
+
+# Repeat compute_pnl_summary calls with no trade_close written in between
+# reuse the previous result for this long (the window edge still slides).
+SUMMARY_TTL_S = 5.0
+
+# ── PnL roll-up ─────────────────────────────────────────────────────────────
+
+# realized_pnl is a VIRTUAL generated column (STORED ones cannot be added to
+# an existing table); the partial index below materialises it for
+# trade_close rows, so windowed sums read the index and never parse JSON.
+# The query pins it with INDEXED BY: without ANALYZE statistics the planner
+# would otherwise pick idx_events_type_ts.
+_REALIZED_PNL_COLUMN = (
+    "realized_pnl REAL GENERATED ALWAYS AS "
+    "(json_extract(payload, '$.realized_pnl')) VIRTUAL"
+)
+
+# Per-minute trade_close totals, so a window costs one row per minute
+# however many trades it holds.  The window sums whole minutes from the
+# roll-up (from ?1, the first minute boundary at or after the cutoff) and
+# the partial minute [?2, ?1) from idx_events_close_pnl.
+ROLLUP_BUCKET_S = 60
+_SQL_ROLLUP_STEP = (
+    "INSERT INTO pnl_rollup_minute (minute_ts, sum_pnl, cnt) VALUES (?, ?, 1) "
+    "ON CONFLICT (minute_ts) DO UPDATE SET "
+    "sum_pnl = sum_pnl + excluded.sum_pnl, cnt = cnt + 1"
+)
+_SQL_ROLLUP_BACKFILL = (
+    "INSERT INTO pnl_rollup_minute (minute_ts, sum_pnl, cnt) "
+    f"SELECT CAST(ts AS INTEGER) / {ROLLUP_BUCKET_S} * {ROLLUP_BUCKET_S}, "
+    "SUM(COALESCE(realized_pnl, 0.0)), COUNT(*) "
+    f"FROM events WHERE type = '{EVENT_TRADE_CLOSE}' GROUP BY 1"
+)
+_SQL_WINDOW_PNL = (
+    "SELECT "
+    "(SELECT COALESCE(SUM(sum_pnl), 0.0) FROM pnl_rollup_minute "
+    "WHERE minute_ts >= ?1) + "
+    "(SELECT COALESCE(SUM(realized_pnl), 0.0) "
+    "FROM events INDEXED BY idx_events_close_pnl "
+    f"WHERE type = '{EVENT_TRADE_CLOSE}' AND ts >= ?2 AND ts < ?1)"
+)
+
+# Running totals over every trade_close, advanced inside the writer's
+# transaction.  SET expressions see the pre-update row, so the new
+# cumulative value (cum_pnl + ?1) is spelled out rather than read back.
+_SQL_PNL_STEP = (
+    "UPDATE pnl_state SET cum_pnl = cum_pnl + ?1, "
+    "peak = MAX(peak, cum_pnl + ?1), "
+    "max_dd = MAX(max_dd, MAX(peak, cum_pnl + ?1) - (cum_pnl + ?1)), "
+    "total_closed = total_closed + 1 "
+    "WHERE id = 1"
+)
+
 # ── Abstract interface (what callers see) ───────────────────────────────────
 
 
@@ -38,9 +171,13 @@ class PerformanceLog:
 
     Public API:
         append_event(event)     – persist a structured event
+        append_event_preserialized(type, json, ts) – same, payload pre-encoded
+        append_nowait(type, json, ts) – queue an append without waiting
         get_latest_snapshot()   – most recent pnl_snapshot event
         iter_events(limit)      – async iterator over recent events
-        get_events_since(ts)    – events after a unix timestamp
+        fetch_events(limit)     – same, collected into a list
+        iter_events_since(ts)   – async iterator over events after a timestamp
+        get_events_since(ts)    – same, collected into a list
         compute_pnl_summary()   – derive a PnL summary from the log
     """
 
@@ -48,28 +185,185 @@ class PerformanceLog:
         self._db_path = db_path or os.getenv(
             "PERFORMANCE_LOG_DB", "data/performance_log.db"
         )
-        self._db: aiosqlite.Connection | None = None
+        self._db: aiosqlite.Connection | None = None  # the writer
+        self._readers: asyncio.Queue[aiosqlite.Connection] | None = None
+        self._reader_conns: list[aiosqlite.Connection] = []  # idle or borrowed
+        # (ts, type, payload_json, future resolving to seq)
+        self._queue: asyncio.Queue[
+            tuple[float, str, str, asyncio.Future[int]]
+        ] | None = None
+        self._writer: asyncio.Task | None = None
+        # Read caches, kept current by the writer.
+        self._latest_snapshot: dict[str, Any] | None = None
+        self._closes_written = 0
+        # window_hours → (monotonic_ts, closes_written, summary)
+        self._summary_cache: dict[float, tuple[float, int, dict[str, Any]]] = {}
 
     # ── lifecycle ───────────────────────────────────────────────────────
 
     async def open(self) -> None:
         """Open the database and ensure the schema exists."""
         Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
-        self._db = await aiosqlite.connect(self._db_path)
-        await self._db.execute(
-            """
+        # Autocommit mode: the writer issues its own BEGIN IMMEDIATE/COMMIT
+        # around each batch instead of sqlite3's implicit transactions.
+        self._db = db = await aiosqlite.connect(
+            self._db_path, isolation_level=None
+        )
+        wal = self._db_path != ":memory:" and await self._configure()
+        await db.execute("BEGIN IMMEDIATE")
+        await db.execute(
+            f"""
             CREATE TABLE IF NOT EXISTS events (
                 seq      INTEGER PRIMARY KEY AUTOINCREMENT,
                 ts       REAL    NOT NULL,
                 type     TEXT    NOT NULL,
-                payload  TEXT    NOT NULL
+                payload  TEXT    NOT NULL,
+                {_REALIZED_PNL_COLUMN}
+            )
+            """
+        )
+        async with db.execute("PRAGMA table_xinfo(events)") as cursor:
+            columns = {row[1] async for row in cursor}
+        if "realized_pnl" not in columns:
+            await db.execute(
+                f"ALTER TABLE events ADD COLUMN {_REALIZED_PNL_COLUMN}"
+            )
+        # Serves the windowed (type, ts range) reads as a range seek.
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (type, ts)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_close_pnl "
+            f"ON events (ts, realized_pnl) WHERE type = '{EVENT_TRADE_CLOSE}'"
+        )
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pnl_state (
+                id            INTEGER PRIMARY KEY CHECK (id = 1),
+                cum_pnl       REAL    NOT NULL,
+                peak          REAL    NOT NULL,
+                max_dd        REAL    NOT NULL,
+                total_closed  INTEGER NOT NULL
             )
             """
         )
-        await self._db.commit()
+        await self._seed_pnl_state()
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pnl_rollup_minute (
+                minute_ts  INTEGER PRIMARY KEY,
+                sum_pnl    REAL    NOT NULL,
+                cnt        INTEGER NOT NULL
+            )
+            """
+        )
+        async with db.execute("SELECT 1 FROM pnl_rollup_minute LIMIT 1") as cursor:
+            if await cursor.fetchone() is None:
+                await db.execute(_SQL_ROLLUP_BACKFILL)
+        await db.execute("COMMIT")
+        if wal:
+            self._readers = asyncio.Queue()
+            self._reader_conns = await asyncio.gather(
+                *(self._open_reader() for _ in range(READER_POOL_SIZE))
+            )
+            for conn in self._reader_conns:
+                self._readers.put_nowait(conn)
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._drain(self._queue))
         logger.info("Performance log opened at %s", self._db_path)
 
+    def _require_db(self) -> aiosqlite.Connection:
+        db = self._db
+        if db is None:
+            raise RuntimeError("Log not open – call .open() first")
+        return db
+
+    async def _configure(self) -> bool:
+        """Switch to WAL and apply the tuning pragmas; False if WAL is refused."""
+        db = self._require_db()
+        await db.execute(f"PRAGMA page_size={PAGE_SIZE}")
+        async with db.execute("PRAGMA journal_mode=WAL") as cursor:
+            (mode,) = await cursor.fetchone()
+        if str(mode).lower() != "wal":
+            # e.g. network filesystems without shared-memory support; the
+            # default rollback journal keeps full durability there.
+            logger.warning(
+                "WAL unavailable for %s (journal_mode=%s)", self._db_path, mode
+            )
+            return False
+        for pragma in _PRAGMAS:
+            await db.execute(pragma)
+        await db.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        return True
+
+    async def _open_reader(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self._db_path)
+        await conn.execute("PRAGMA query_only=1")
+        await conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        return conn
+
+    @contextlib.asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled reader; without a pool, reads share the writer."""
+        db = self._require_db()
+        readers = self._readers
+        if readers is None:
+            yield db
+            return
+        conn = await readers.get()
+        try:
+            yield conn
+        finally:
+            # After close() the pool is gone and conn is already closed.
+            if self._readers is readers:
+                readers.put_nowait(conn)
+
+    async def _seed_pnl_state(self) -> None:
+        """Create the pnl_state row, replaying any trade_close history."""
+        db = self._require_db()
+        async with db.execute("SELECT 1 FROM pnl_state") as cursor:
+            if await cursor.fetchone() is not None:
+                return
+
+        cumulative_pnl = 0.0
+        peak = 0.0
+        max_drawdown = 0.0
+        total = 0
+        async for _, pnl in self._iter_pnl_closes_asc():
+            cumulative_pnl += pnl or 0.0
+            if cumulative_pnl > peak:
+                peak = cumulative_pnl
+            dd = peak - cumulative_pnl
+            if dd > max_drawdown:
+                max_drawdown = dd
+            total += 1
+        await db.execute(
+            "INSERT INTO pnl_state VALUES (1, ?, ?, ?, ?)",
+            (cumulative_pnl, peak, max_drawdown, total),
+        )
+
+    async def _iter_pnl_closes_asc(self) -> AsyncIterator[tuple[float, float | None]]:
+        """Yield ``(ts, realized_pnl)`` for every trade_close, oldest first."""
+        db = self._require_db()
+        async with db.execute(
+            _SQL_PNL_CLOSES_ASC, (EVENT_TRADE_CLOSE,)
+        ) as cursor:
+            async for row in cursor:
+                yield row
+
     async def close(self) -> None:
+        """Flush queued appends, then close the database."""
+        if self._writer and self._queue:
+            await self._queue.join()
+            self._writer.cancel()
+            self._writer = None
+            self._queue = None
+        # Borrowed readers too: an iterator abandoned without being closed
+        # would otherwise keep its connection and thread alive.
+        self._readers = None
+        conns, self._reader_conns = self._reader_conns, []
+        for conn in conns:
+            await conn.close()
         if self._db:
             await self._db.close()
             self._db = None
@@ -85,61 +379,194 @@ class PerformanceLog:
 
         Returns the sequence number of the new event.
         """
-        assert self._db is not None, "Log not open – call .open() first"
-        ts = event.get("ts", time.time())
-        etype = event["type"]
-        payload = json.dumps(event.get("payload", {}))
-        cursor = await self._db.execute(
-            "INSERT INTO events (ts, type, payload) VALUES (?, ?, ?)",
-            (ts, etype, payload),
+        return await self.append_event_preserialized(
+            event["type"], orjson.dumps(event.get("payload", {})), event.get("ts")
         )
-        await self._db.commit()
-        seq = cursor.lastrowid
-        logger.debug("Appended event seq=%s type=%s", seq, etype)
-        return seq  # type: ignore[return-value]
+
+    async def append_event_preserialized(
+        self, etype: str, payload_json: str | bytes, ts: float | None = None
+    ) -> int:
+        """
+        Append an event whose payload is already JSON-encoded.
+
+        *payload_json* may be ``str`` or UTF-8 ``bytes`` (e.g. from orjson);
+        it is stored verbatim.  Returns the sequence number once committed.
+        """
+        return await self.append_nowait(etype, payload_json, ts)
+
+    def append_nowait(
+        self, etype: str, payload_json: str | bytes, ts: float | None = None
+    ) -> asyncio.Future[int]:
+        """
+        Queue a pre-encoded event for the background writer and return a
+        future that resolves to its sequence number once committed.
+        """
+        if self._queue is None:
+            raise RuntimeError("Log not open – call .open() first")
+        if ts is None:
+            ts = time.time()
+        if isinstance(payload_json, bytes):
+            payload_json = payload_json.decode()
+        fut: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((ts, etype, payload_json, fut))
+        return fut
+
+    async def _drain(
+        self, queue: asyncio.Queue[tuple[float, str, str, asyncio.Future[int]]]
+    ) -> None:
+        """Writer task: commit queued events in batches of up to MAX_BATCH."""
+        while True:
+            batch = [await queue.get()]
+            if (
+                not queue.empty()
+                and batch[0][1] != EVENT_TRADE_CLOSE
+                and queue.qsize() < MAX_BATCH - 1
+            ):
+                await asyncio.sleep(BATCH_LINGER_S)
+            while len(batch) < MAX_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._write_batch(batch)
+            except Exception as exc:
+                # Never let the writer die: callers would wait forever.
+                logger.exception("Writing %d log events failed", len(batch))
+                _fail(batch, exc)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write_batch(
+        self, batch: list[tuple[float, str, str, asyncio.Future[int]]]
+    ) -> None:
+        """Commit *batch*, resolving every future with its seq or the error."""
+        db = self._require_db()
+        try:
+            seqs, closes = await self._insert_batch(db, batch)
+        except Exception as exc:
+            try:
+                if db.in_transaction:
+                    await db.execute("ROLLBACK")
+            except Exception:
+                logger.exception("Rolling back a failed log batch failed")
+            if len(batch) > 1:
+                # Retry one by one so a bad event fails only itself.
+                for item in batch:
+                    await self._write_batch([item])
+                return
+            _fail(batch, exc)
+            return
+        snapshot = None
+        for seq, (ts, etype, payload, fut) in zip(seqs, batch):
+            if etype == EVENT_PNL_SNAPSHOT:
+                snapshot = (seq, ts, etype, payload)
+            if not fut.done():
+                fut.set_result(seq)
+        if snapshot is not None:
+            self._latest_snapshot = _row_to_event(snapshot)
+        self._closes_written += len(closes)
+        logger.debug("Appended %d events, seq %d..%d", len(seqs), seqs[0], seqs[-1])
+
+    async def _insert_batch(
+        self,
+        db: aiosqlite.Connection,
+        batch: list[tuple[float, str, str, asyncio.Future[int]]],
+    ) -> tuple[list[int], list[tuple[int, float]]]:
+        """
+        Insert *batch* and advance the PnL roll-ups in one transaction.
+        Returns the seqs in batch order and the ``(minute, pnl)`` closes.
+        """
+        rows = [(ts, etype, payload) for ts, etype, payload, _ in batch]
+        await db.execute("BEGIN IMMEDIATE")
+        if _HAS_RETURNING:
+            seqs: list[int] = []
+            for i in range(0, len(rows), _INSERT_CHUNK):
+                chunk = rows[i : i + _INSERT_CHUNK]
+                returned = await db.execute_fetchall(
+                    _sql_insert_events(len(chunk)), [v for row in chunk for v in row]
+                )
+                # RETURNING order is unspecified, but AUTOINCREMENT hands
+                # out ascending seqs in VALUES order.
+                seqs += sorted(seq for (seq,) in returned)
+        else:
+            await db.executemany(_SQL_INSERT_EVENT, rows)
+            async with db.execute("SELECT last_insert_rowid()") as cursor:
+                (last,) = await cursor.fetchone()
+            # One writer, one transaction: the batch got consecutive seqs.
+            seqs = list(range(last - len(rows) + 1, last + 1))
+        closes = [
+            (int(ts) // ROLLUP_BUCKET_S * ROLLUP_BUCKET_S, _realized_pnl(payload))
+            for ts, etype, payload, _ in batch
+            if etype == EVENT_TRADE_CLOSE
+        ]
+        if closes:
+            await db.executemany(_SQL_PNL_STEP, [(pnl,) for _, pnl in closes])
+            await db.executemany(_SQL_ROLLUP_STEP, closes)
+        await db.execute("COMMIT")
+        return seqs, closes
 
     # ── reads ───────────────────────────────────────────────────────────
 
     async def get_latest_snapshot(self) -> dict[str, Any] | None:
-        """Return the most recent ``pnl_snapshot`` event, or None."""
-        assert self._db is not None
-        async with self._db.execute(
-            "SELECT seq, ts, type, payload FROM events "
-            "WHERE type = ? ORDER BY seq DESC LIMIT 1",
-            (EVENT_PNL_SNAPSHOT,),
+        """
+        Return the most recent ``pnl_snapshot`` event, or None.  Served from
+        memory once loaded; the writer replaces it on every new snapshot.
+        Callers get a shallow copy.
+        """
+        self._require_db()
+        if self._latest_snapshot is not None:
+            return dict(self._latest_snapshot)
+        async with self._reader() as db, db.execute(
+            _SQL_LATEST_OF_TYPE, (EVENT_PNL_SNAPSHOT,)
         ) as cursor:
             row = await cursor.fetchone()
         if row is None:
             return None
-        return _row_to_event(row)
+        if self._latest_snapshot is None:
+            self._latest_snapshot = _row_to_event(row)
+        return dict(self._latest_snapshot)
 
     async def iter_events(
         self, limit: int | None = None, event_type: str | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield recent events, newest first, without materialising them all.
+
+        The iterator holds a pooled reader until it is exhausted or closed;
+        a caller that may stop early must close it, e.g. with
+        ``contextlib.aclosing``.
+        """
+        query = _SQL_ITER[bool(event_type), bool(limit)]
+        params: tuple[Any, ...] = (event_type,) if event_type else ()
+        if limit:
+            params += (limit,)
+        async with self._reader() as db, db.execute(query, params) as cursor:
+            async for row in cursor:
+                yield _row_to_event(row)
+
+    async def fetch_events(
+        self, limit: int | None = None, event_type: str | None = None
     ) -> list[dict[str, Any]]:
         """Return recent events, newest first."""
-        assert self._db is not None
-        query = "SELECT seq, ts, type, payload FROM events"
-        params: list[Any] = []
-        if event_type:
-            query += " WHERE type = ?"
-            params.append(event_type)
-        query += " ORDER BY seq DESC"
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
-        async with self._db.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-        return [_row_to_event(r) for r in rows]
+        async with contextlib.aclosing(self.iter_events(limit, event_type)) as it:
+            return [e async for e in it]
+
+    async def iter_events_since(
+        self, since_ts: float
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield events with ts >= *since_ts*, oldest first, as they are read.
+        Like ``iter_events``, close the iterator when stopping early.
+        """
+        async with self._reader() as db, db.execute(
+            _SQL_EVENTS_SINCE, (since_ts,)
+        ) as cursor:
+            async for row in cursor:
+                yield _row_to_event(row)
 
     async def get_events_since(self, since_ts: float) -> list[dict[str, Any]]:
         """Return all events with ts >= *since_ts*, oldest first."""
-        assert self._db is not None
-        async with self._db.execute(
-            "SELECT seq, ts, type, payload FROM events WHERE ts >= ? ORDER BY seq ASC",
-            (since_ts,),
-        ) as cursor:
-            rows = await cursor.fetchall()
-        return [_row_to_event(r) for r in rows]
+        async with contextlib.aclosing(self.iter_events_since(since_ts)) as it:
+            return [e async for e in it]
 
     # ── derived analytics ───────────────────────────────────────────────
 
@@ -151,51 +578,81 @@ class PerformanceLog:
         Derive a PnL summary from trade_close events in the given window.
 
         Returns cumulative_pnl, realized_pnl_window, max_drawdown, and the
-        window duration.
+        window duration.  Lifetime figures come from the pnl_state roll-up;
+        only the window is aggregated from events.
         """
-        assert self._db is not None
-
-        # All trade_close events
-        all_closes = await self.iter_events(event_type=EVENT_TRADE_CLOSE)
-        all_closes.reverse()  # oldest first
-
-        cumulative_pnl = 0.0
-        peak = 0.0
-        max_drawdown = 0.0
-        for ev in all_closes:
-            pnl = ev["payload"].get("realized_pnl", 0.0)
-            cumulative_pnl += pnl
-            if cumulative_pnl > peak:
-                peak = cumulative_pnl
-            dd = peak - cumulative_pnl
-            if dd > max_drawdown:
-                max_drawdown = dd
-
-        # Windowed PnL
-        cutoff = time.time() - window_hours * 3600
-        window_closes = [e for e in all_closes if e["ts"] >= cutoff]
-        realized_window = sum(
-            e["payload"].get("realized_pnl", 0.0) for e in window_closes
-        )
-
-        return {
+        self._require_db()
+        hit = self._summary_cache.get(window_hours)
+        if (
+            hit is not None
+            and hit[1] == self._closes_written
+            and time.monotonic() - hit[0] < SUMMARY_TTL_S
+        ):
+            return dict(hit[2])
+        closes_written = self._closes_written
+
+        async with self._reader() as db:
+            async with db.execute(_SQL_PNL_STATE) as cursor:
+                cumulative_pnl, max_drawdown, total_closed = await cursor.fetchone()
+
+            # Windowed PnL
+            cutoff = time.time() - window_hours * 3600
+            first_minute = -(-cutoff // ROLLUP_BUCKET_S) * ROLLUP_BUCKET_S
+            async with db.execute(
+                _SQL_WINDOW_PNL, (first_minute, cutoff)
+            ) as cursor:
+                (realized_window,) = await cursor.fetchone()
+
+        summary = {
             "cumulative_pnl_usd": round(cumulative_pnl, 4),
             "realized_pnl_window_usd": round(realized_window, 4),
             "window_hours": window_hours,
             "max_drawdown_usd": round(max_drawdown, 4),
-            "total_closed_trades": len(all_closes),
+            "total_closed_trades": total_closed,
         }
+        self._summary_cache[window_hours] = (
+            time.monotonic(), closes_written, summary
+        )
+        return dict(summary)
 
 
 # ── helpers ─────────────────────────────────────────────────────────────────
 
 
+def _realized_pnl(payload_json: str) -> float:
+    payload = orjson.loads(payload_json)
+    if not isinstance(payload, dict):
+        return 0.0
+    return float(payload.get("realized_pnl") or 0.0)
+
+
+def _fail(
+    batch: list[tuple[float, str, str, asyncio.Future[int]]], exc: Exception
+) -> None:
+    """Resolve every still-pending future in *batch* with *exc*."""
+    for *_, fut in batch:
+        if not fut.done():
+            fut.set_exception(exc)
+
+
 def _row_to_event(row: tuple) -> dict[str, Any]:
     seq, ts, etype, payload_str = row
     return {
         "seq": seq,
         "ts": ts,
         "type": etype,
-        "payload": json.loads(payload_str),
-        "iso": datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(),
+        "payload": orjson.loads(payload_str),
     }
+
+
+def iso_utc(ts: float) -> str:
+    """
+    ISO-8601 UTC string for an event ``ts``, to the second.  Events carry
+    only the float; format at the edge when a human-readable time is needed.
+    """
+    return _iso_second(int(ts))
+
+
+@functools.lru_cache(maxsize=1024)
+def _iso_second(ts: int) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
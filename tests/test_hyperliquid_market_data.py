@@ -0,0 +1,127 @@
+"""Market data: the WebSocket feed, its REST fallback and the ctx cache."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from clients.hyperliquid_client import (
+    HyperliquidConfig,
+    HyperliquidPerpsClient,
+    _MarketFeed,
+)
+
+META = {
+    "universe": [{"name": "BTC", "szDecimals": 5}, {"name": "ETH", "szDecimals": 4}]
+}
+CTXS = [{"markPx": "97000.5", "funding": "0.0001"}, {"markPx": "3400.1"}]
+
+
+def _client(feed=None, meta=META, ctxs=CTXS):
+    """A client whose SDK calls are answered locally and counted."""
+    client = object.__new__(HyperliquidPerpsClient)
+    client.cfg = HyperliquidConfig(use_websocket=False, keep_raw=False)
+    client._feed = feed
+    client._ctxs_cache = None
+    client._name_to_idx = {}
+    client._sz_decimals = {}
+    client._universe = ()
+    client._mids_cache = None
+    client._inflight = {}
+    client.calls = []
+
+    def meta_and_asset_ctxs():
+        client.calls.append("meta_and_asset_ctxs")
+        return client.meta, ctxs
+
+    def all_mids():
+        client.calls.append("all_mids")
+        return {"BTC": "97001"}
+
+    async def run(fn, *args):
+        await asyncio.sleep(0)  # let concurrent callers pile up
+        return fn(*args)
+
+    client.meta = meta
+    client._info = SimpleNamespace(
+        meta_and_asset_ctxs=meta_and_asset_ctxs, all_mids=all_mids
+    )
+    client._run = run
+    return client
+
+
+def _feed() -> _MarketFeed:
+    # Never started: the callbacks are driven directly.
+    feed = _MarketFeed("https://api.hyperliquid.test", ("BTC",))
+    feed._on_mids({"data": {"mids": {"BTC": "97010.5", "ETH": "3401"}}})
+    feed._on_ctx({"data": {"coin": "BTC", "ctx": {"markPx": "97011"}}})
+    feed._on_book({"data": {"coin": "BTC", "levels": [[], []]}})
+    return feed
+
+
+def test_feed_callbacks_update_snapshots_and_freshness():
+    feed = _MarketFeed("https://api.hyperliquid.test", ("BTC",))
+    assert not feed.is_fresh("allMids", 5.0)
+    feed = _feed()
+    assert feed.mids == {"BTC": 97010.5, "ETH": 3401.0}
+    assert feed.ctxs["BTC"] == {"markPx": "97011"}
+    assert feed.books["BTC"]["levels"] == [[], []]
+    assert all(feed.is_fresh(k, 5.0) for k in ("allMids", "ctx:BTC", "book:BTC"))
+    assert not feed.is_fresh("ctx:ETH", 5.0)
+    assert not feed.is_fresh("allMids", 0.0)
+
+
+def test_fresh_feed_is_served_without_rest_calls():
+    client = _client(_feed())
+
+    async def main():
+        return await client.get_market_info("BTC"), await client.get_all_mids()
+
+    info, mids = asyncio.run(main())
+    assert info.mark_price == 97011.0
+    assert mids["BTC"] == 97010.5
+    assert client.calls == []
+
+
+def test_stale_feed_falls_back_to_rest():
+    feed = _feed()
+    feed._updated = {k: time.monotonic() - 60 for k in feed._updated}
+    client = _client(feed)
+
+    async def main():
+        return await client.get_market_info("BTC"), await client.get_all_mids()
+
+    info, mids = asyncio.run(main())
+    assert (info.mark_price, info.funding_rate) == (97000.5, 0.0001)
+    assert mids["BTC"] == 97001.0
+    assert client.calls == ["meta_and_asset_ctxs", "all_mids"]
+
+
+def test_asset_ctxs_are_single_flight_and_cached():
+    client = _client()
+
+    async def main():
+        infos = await asyncio.gather(
+            *(client.get_market_info(s) for s in ("BTC", "ETH", "BTC"))
+        )
+        await client.get_market_info("ETH")
+        return infos
+
+    infos = asyncio.run(main())
+    assert [i.mark_price for i in infos] == [97000.5, 3400.1, 97000.5]
+    assert client.calls == ["meta_and_asset_ctxs"]
+
+
+def test_index_follows_a_changed_universe():
+    client = _client()
+
+    async def main():
+        await client.get_market_info("BTC")
+        client._ctxs_cache = None  # TTL expired
+        client.meta = {"universe": [{"name": "ETH", "szDecimals": 4}]}
+        with pytest.raises(ValueError):
+            await client.get_market_info("SOL")
+        return client._name_to_idx, client._sz_decimals
+
+    assert asyncio.run(main()) == ({"ETH": 0}, {"ETH": 4})
@@ -0,0 +1,78 @@
+"""Hyperliquid order pricing and parsing of order responses."""
+
+from types import SimpleNamespace
+
+import pytest
+from hyperliquid.exchange import Exchange
+
+from clients.hyperliquid_client import (
+    HyperliquidConfig,
+    HyperliquidPerpsClient,
+    _slippage_px,
+)
+
+
+def _parse(result, is_buy=True, keep_raw=False):
+    # _parse_order_result only reads cfg; no SDK connection is needed.
+    client = SimpleNamespace(cfg=HyperliquidConfig(keep_raw=keep_raw))
+    return HyperliquidPerpsClient._parse_order_result(
+        client, result, "BTC", is_buy, 0.01, "market"
+    )
+
+
+def _ok(*statuses):
+    return {"status": "ok", "response": {"data": {"statuses": list(statuses)}}}
+
+
+@pytest.mark.parametrize(
+    "status, order_id, expected",
+    [
+        ({"filled": {"oid": 77, "totalSz": "0.01"}}, "77", "submitted"),
+        ({"resting": {"oid": 78}}, "78", "submitted"),
+        ({"filled": {}}, "", "unknown"),
+        ({"error": "Insufficient margin"}, "Insufficient margin", "error"),
+        ("success", "", "filled"),
+        ("waitingForFill", "", "submitted"),
+    ],
+)
+def test_statuses(status, order_id, expected):
+    parsed = _parse(_ok(status))
+    assert (parsed.order_id, parsed.status) == (order_id, expected)
+
+
+@pytest.mark.parametrize(
+    "result", [None, "err", {}, {"response": "x"}, _ok(), {"response": {"data": 1}}]
+)
+def test_unexpected_shapes_are_unknown(result):
+    parsed = _parse(result)
+    assert (parsed.order_id, parsed.status) == ("", "unknown")
+
+
+@pytest.mark.parametrize(
+    "is_buy, side", [(True, "buy"), (False, "sell"), (None, "unknown")]
+)
+def test_side(is_buy, side):
+    assert _parse(_ok("success"), is_buy).side == side
+
+
+def test_raw_is_kept_only_on_request():
+    result = _ok({"resting": {"oid": 1}})
+    assert _parse(result).raw is None
+    assert _parse(result, keep_raw=True).raw is result
+    assert _parse("err", keep_raw=True).raw == {"raw": "err"}
+
+
+@pytest.mark.parametrize("px", [97_123.456, 3_456.789, 0.123456, 1.0, 12.3456789])
+@pytest.mark.parametrize("is_buy", [True, False])
+@pytest.mark.parametrize("sz_decimals", [0, 2, 5])
+@pytest.mark.parametrize("slippage", [0.0, 0.01, 0.05])
+def test_slippage_px_matches_sdk(px, is_buy, sz_decimals, slippage):
+    info = SimpleNamespace(
+        name_to_coin={"X": "X"},
+        coin_to_asset={"X": 3},
+        asset_to_sz_decimals={3: sz_decimals},
+    )
+    # The SDK helper is private; it is only the reference here.
+    exchange = SimpleNamespace(info=info)
+    expected = Exchange._slippage_price(exchange, "X", is_buy, slippage, px)
+    assert _slippage_px(px, is_buy, slippage, sz_decimals) == expected
@@ -0,0 +1,47 @@
+"""The fast L1 signer must match the SDK's own signature byte for byte."""
+
+import pytest
+from eth_account import Account
+from hyperliquid.utils import signing
+
+from clients.hyperliquid_client import _fast_sign_l1_action
+
+WALLET = Account.from_key("0x" + "11" * 32)
+VAULT = "0x" + "22" * 20
+
+ORDER = {
+    "type": "order",
+    "orders": [
+        {
+            "a": 0,
+            "b": True,
+            "p": "65000",
+            "s": "0.001",
+            "r": False,
+            "t": {"limit": {"tif": "Ioc"}},
+        }
+    ],
+    "grouping": "na",
+}
+CANCEL = {"type": "cancel", "cancels": [{"a": 1, "o": 123456}]}
+
+
+@pytest.mark.parametrize("action", [ORDER, CANCEL])
+@pytest.mark.parametrize("active_pool", [None, VAULT])
+@pytest.mark.parametrize("expires_after", [None, 1_700_000_060_000])
+@pytest.mark.parametrize("is_mainnet", [True, False])
+def test_matches_sdk_signature(action, active_pool, expires_after, is_mainnet):
+    args = (WALLET, action, active_pool, 1_700_000_000_000, expires_after, is_mainnet)
+    assert _fast_sign_l1_action(*args) == signing.sign_l1_action(*args)
+
+
+class _LegacyWallet:
+    """eth-account < 0.13 wallet: ``sign_message`` but no ``unsafe_sign_hash``."""
+
+    def sign_message(self, message):
+        return WALLET.sign_message(message)
+
+
+def test_falls_back_without_unsafe_sign_hash():
+    args = (_LegacyWallet(), ORDER, None, 1_700_000_000_000, None, True)
+    assert _fast_sign_l1_action(*args) == signing.sign_l1_action(WALLET, *args[1:])
@@ -0,0 +1,63 @@
+"""The shared clearinghouseState cache must not outlive a trade."""
+
+import asyncio
+from types import SimpleNamespace
+
+from clients.hyperliquid_client import HyperliquidPerpsClient
+
+
+def _client(fetch):
+    # Only the user-state cache is exercised; no SDK connection is needed.
+    client = object.__new__(HyperliquidPerpsClient)
+    client.cfg = SimpleNamespace(wallet_address="0xabc")
+    client._user_state_lock = asyncio.Lock()
+    client._user_state_cache = None
+    client._user_state_ttl = 60.0
+    client._user_state_gen = 0
+    client._info_call = fetch
+    return client
+
+
+def test_fetch_straddling_a_trade_is_not_cached():
+    async def main():
+        fetches = []
+        release = asyncio.Event()
+
+        async def fetch(method, address):
+            fetches.append(method)
+            if len(fetches) == 1:
+                await release.wait()
+                return {"positions": "before trade"}
+            return {"positions": "after trade"}
+
+        client = _client(fetch)
+        client._run = lambda *a, **kw: asyncio.sleep(0, "order ok")
+        client._exchange = SimpleNamespace(order=None)
+
+        before = asyncio.create_task(client._user_state())
+        await asyncio.sleep(0)
+        await client._exchange_call("order")
+        release.set()
+        assert await before == {"positions": "before trade"}
+        return await client._user_state(), len(fetches)
+
+    after, fetches = asyncio.run(main())
+    assert after == {"positions": "after trade"}
+    assert fetches == 2
+
+
+def test_state_is_shared_between_trades():
+    async def main():
+        fetches = []
+
+        async def fetch(method, address):
+            fetches.append(method)
+            return {"n": len(fetches)}
+
+        client = _client(fetch)
+        first, second = await asyncio.gather(client._user_state(), client._user_state())
+        return first, second, len(fetches)
+
+    first, second, fetches = asyncio.run(main())
+    assert first == second == {"n": 1}
+    assert fetches == 1
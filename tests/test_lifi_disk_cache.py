@@ -0,0 +1,92 @@
+"""Li.Fi reference-data cache persisted to disk and revalidated by ETag."""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from clients.lifi_client import LifiClient, LifiConfig
+
+CHAINS = {"chains": [{"id": 1, "key": "eth"}]}
+
+
+def _client(cache_dir, requests: list) -> LifiClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=orjson.dumps(CHAINS), headers={"ETag": '"v1"'}
+        )
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return LifiClient(LifiConfig(cache_dir=str(cache_dir)), http_client=http)
+
+
+async def _get_chains(client: LifiClient):
+    try:
+        return await client.get_chains()
+    finally:
+        await client.close()
+        await client._http.aclose()
+
+
+def test_restart_revalidates_with_etag(tmp_path):
+    requests: list[httpx.Request] = []
+    assert asyncio.run(_get_chains(_client(tmp_path, requests))) == CHAINS
+    assert (tmp_path / "cache.json").exists()
+
+    assert asyncio.run(_get_chains(_client(tmp_path, requests))) == CHAINS
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not json",
+        b"5",
+        b'{"a": 1}',
+        b"[1, 2]",
+        b'[["GET", "/chains", [], null, {}]]',
+        b'[["GET", "/chains", [["chainTypes", ["EVM"]]], "\\"v1\\"", {}]]',
+        b'[["GET", "/chains", [["chainTypes", "EVM", 1]], "\\"v1\\"", {}]]',
+        b'[["GET", "/chains", {"chainTypes": "EVM"}, "\\"v1\\"", {}]]',
+        b'[["GET", "/chains", [], "\\"v1\\"", {}], ["GET"]]',
+    ],
+)
+def test_malformed_file_is_ignored_as_a_whole(tmp_path, content):
+    (tmp_path / "cache.json").write_bytes(content)
+    client = _client(tmp_path, [])
+    client._load_disk_cache()
+    assert client._cache == {}
+
+
+def test_failed_load_is_not_kept(tmp_path, monkeypatch):
+    requests: list[httpx.Request] = []
+    client = _client(tmp_path, requests)
+
+    def broken_load():
+        raise RuntimeError("disk on fire")
+
+    monkeypatch.setattr(client, "_load_disk_cache", broken_load)
+    assert asyncio.run(_get_chains(client)) == CHAINS
+    assert client._disk_load is None
+    assert len(requests) == 1
+
+
+def test_results_do_not_alias_the_cache(tmp_path):
+    async def main():
+        client = _client(tmp_path, [])
+        try:
+            first = await client.get_chains()
+            first["chains"].clear()
+            return await client.get_chains()
+        finally:
+            await client.close()
+            await client._http.aclose()
+
+    assert asyncio.run(main()) == CHAINS
+    saved = orjson.loads((tmp_path / "cache.json").read_bytes())
+    assert saved[0][4] == CHAINS
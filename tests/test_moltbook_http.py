@@ -0,0 +1,45 @@
+"""Sharing of the Moltbook HTTP client between MoltbookClient instances."""
+
+import asyncio
+
+from clients.moltbook_client import _CLIENT_CACHE, MoltbookClient, MoltbookConfig
+
+
+def _cfg(**kw) -> MoltbookConfig:
+    return MoltbookConfig(base_url="https://moltbook.test", **kw)
+
+
+async def _pair(cfg_a, cfg_b):
+    a, b = MoltbookClient(cfg_a), MoltbookClient(cfg_b)
+    shared = a._http is b._http
+    await a.close()
+    still_open = not b._http.is_closed
+    await b.close()
+    return shared, still_open, b._http.is_closed
+
+
+def test_clients_on_one_loop_share_a_pool_until_the_last_close():
+    assert asyncio.run(_pair(_cfg(), _cfg())) == (True, True, True)
+    assert not any(_CLIENT_CACHE.values())
+
+
+def test_different_pool_limits_get_their_own_client():
+    shared, _, _ = asyncio.run(_pair(_cfg(), _cfg(max_connections=5)))
+    assert not shared
+
+
+def test_loops_never_share_a_client():
+    async def open_client():
+        return MoltbookClient(_cfg())
+
+    first = asyncio.run(open_client())  # left open: its loop is gone
+    second = asyncio.run(open_client())
+    assert second._http is not first._http
+    asyncio.run(second.close())
+
+
+def test_client_created_outside_a_loop_is_private():
+    a, b = MoltbookClient(_cfg()), MoltbookClient(_cfg())
+    assert a._http is not b._http
+    asyncio.run(a.close())
+    asyncio.run(b.close())
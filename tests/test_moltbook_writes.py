@@ -0,0 +1,77 @@
+"""Local write throttling: when a failed Moltbook write gives its slot back."""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from clients.moltbook_client import MoltbookClient, MoltbookConfig
+
+
+def _run_post(outcome):
+    """Post twice; the first POST fails with *outcome*, later ones succeed."""
+    posts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":  # latest-post fallback: nothing published
+            return httpx.Response(200, content=b'{"posts": []}')
+        posts.append(request)
+        if len(posts) == 1:
+            if isinstance(outcome, int):
+                return httpx.Response(outcome, request=request)
+            raise outcome
+        return httpx.Response(200, content=orjson.dumps({"post": {"id": "p2"}}))
+
+    async def main():
+        cfg = MoltbookConfig(
+            base_url="https://moltbook.test", private_key="0x" + "11" * 32
+        )
+        client = MoltbookClient(cfg)
+        await client._http.aclose()
+        client._http = httpx.AsyncClient(
+            base_url=cfg.base_url, transport=httpx.MockTransport(handler)
+        )
+        try:
+            with pytest.raises(Exception):
+                await client.create_post("first")
+            try:
+                second = await client.create_post("second")
+            except RuntimeError:
+                second = None  # window still closed, no post to fall back on
+            return second
+        finally:
+            await client.close()
+
+    return asyncio.run(main()), len(posts)
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [httpx.ConnectError("refused"), httpx.ConnectTimeout("slow dial"), 400, 422],
+)
+def test_slot_is_refunded_when_the_post_never_applied(outcome):
+    second, posts = _run_post(outcome)
+    assert second == {"post": {"id": "p2"}}
+    assert posts == 2
+
+
+@pytest.mark.parametrize("outcome", [httpx.ReadTimeout("no answer"), 500, 502])
+def test_slot_stays_spent_when_the_post_may_exist(outcome):
+    second, posts = _run_post(outcome)
+    assert second is None
+    assert posts == 1
+
+
+def test_signing_without_a_key_raises(monkeypatch):
+    monkeypatch.delenv("MOLTBOOK_AGENT_PRIVATE_KEY", raising=False)
+
+    async def main():
+        client = MoltbookClient(MoltbookConfig(base_url="https://moltbook.test"))
+        try:
+            await client._auth_headers("CreatePost")
+        finally:
+            await client.close()
+
+    with pytest.raises(RuntimeError, match="MOLTBOOK_AGENT_PRIVATE_KEY"):
+        asyncio.run(main())
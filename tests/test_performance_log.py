@@ -0,0 +1,211 @@
+"""PerformanceLog: batched writes, seq mapping, roll-ups and read caches."""
+
+import asyncio
+import time
+
+import orjson
+import pytest
+
+from store import performance_log
+from store.performance_log import (
+    EVENT_PNL_SNAPSHOT,
+    EVENT_TRADE_CLOSE,
+    EVENT_TRADE_OPEN,
+    PerformanceLog,
+    _realized_pnl,
+)
+
+
+async def _opened(path) -> PerformanceLog:
+    log = PerformanceLog(str(path))
+    await log.open()
+    return log
+
+
+def _close(pnl: float, ts: float | None = None) -> dict:
+    event = {"type": EVENT_TRADE_CLOSE, "payload": {"realized_pnl": pnl}}
+    if ts is not None:
+        event["ts"] = ts
+    return event
+
+
+@pytest.fixture(params=[True, False], ids=["returning", "last_insert_rowid"])
+def insert_mode(request, monkeypatch):
+    monkeypatch.setattr(performance_log, "_HAS_RETURNING", request.param)
+    return request.param
+
+
+def test_concurrent_appends_get_seqs_in_submission_order(tmp_path, insert_mode):
+    async def main():
+        log = await _opened(tmp_path / "log.db")
+        try:
+            seqs = await asyncio.gather(
+                *(
+                    log.append_event({"type": EVENT_TRADE_OPEN, "payload": {"i": i}})
+                    for i in range(700)
+                )
+            )
+            events = await log.fetch_events()
+        finally:
+            await log.close()
+        return seqs, events
+
+    seqs, events = asyncio.run(main())
+    assert seqs == list(range(1, 701))
+    assert [e["seq"] for e in events] == seqs[::-1]
+    assert [e["payload"]["i"] for e in events] == list(range(699, -1, -1))
+
+
+def test_bad_event_fails_alone_and_writer_survives(tmp_path):
+    async def main():
+        log = await _opened(tmp_path / "log.db")
+        try:
+            futs = [
+                log.append_nowait(EVENT_TRADE_OPEN, orjson.dumps({"i": 0})),
+                log.append_nowait(EVENT_TRADE_CLOSE, "not json"),
+                log.append_nowait(EVENT_TRADE_OPEN, orjson.dumps({"i": 1})),
+            ]
+            results = await asyncio.gather(*futs, return_exceptions=True)
+            after = await log.append_event(_close(1.0))
+            summary = await log.compute_pnl_summary()
+        finally:
+            await log.close()
+        return results, after, summary
+
+    results, after, summary = asyncio.run(main())
+    assert isinstance(results[1], Exception)
+    assert isinstance(results[0], int) and isinstance(results[2], int)
+    assert results[0] < results[2] < after
+    assert summary["total_closed_trades"] == 1
+
+
+def test_append_requires_open_log(tmp_path):
+    with pytest.raises(RuntimeError):
+        PerformanceLog(str(tmp_path / "log.db")).append_nowait(EVENT_TRADE_OPEN, "{}")
+
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        ('{"realized_pnl": 1.25}', 1.25),
+        ('{"realized_pnl": null}', 0.0),
+        ('{"realized_pnl": "2"}', 2.0),
+        ("{}", 0.0),
+        ("[1, 2]", 0.0),
+    ],
+)
+def test_realized_pnl(payload, expected):
+    assert _realized_pnl(payload) == expected
+
+
+def test_latest_snapshot_is_by_seq_and_a_copy(tmp_path):
+    now = time.time()
+
+    async def main():
+        log = await _opened(tmp_path / "log.db")
+        try:
+            for n, ts in ((1, now), (2, now - 60)):
+                await log.append_event(
+                    {"type": EVENT_PNL_SNAPSHOT, "payload": {"n": n}, "ts": ts}
+                )
+            snap = await log.get_latest_snapshot()
+            snap["payload"] = None
+            cached = await log.get_latest_snapshot()
+        finally:
+            await log.close()
+        log = await _opened(tmp_path / "log.db")
+        try:
+            loaded = await log.get_latest_snapshot()
+        finally:
+            await log.close()
+        return cached, loaded
+
+    cached, loaded = asyncio.run(main())
+    assert cached["payload"] == {"n": 2}
+    assert loaded == cached
+
+
+def test_pnl_summary_totals_drawdown_and_window(tmp_path, insert_mode):
+    now = time.time()
+
+    async def main():
+        log = await _opened(tmp_path / "log.db")
+        try:
+            await log.append_event(_close(40.0, now - 48 * 3600))
+            for pnl in (10.0, -25.0, 5.0):
+                await log.append_event(_close(pnl, now - 90))
+            await log.append_event(_close(1.5))
+            first = await log.compute_pnl_summary(24)
+            first["cumulative_pnl_usd"] = "mutated"
+            cached = await log.compute_pnl_summary(24)
+            wide = await log.compute_pnl_summary(72)
+        finally:
+            await log.close()
+        # Reopening seeds pnl_state and the roll-up from the stored events.
+        log = await _opened(tmp_path / "log.db")
+        try:
+            reopened = await log.compute_pnl_summary(24)
+        finally:
+            await log.close()
+        return cached, wide, reopened
+
+    cached, wide, reopened = asyncio.run(main())
+    assert cached == {
+        "cumulative_pnl_usd": 31.5,
+        "realized_pnl_window_usd": -8.5,
+        "window_hours": 24,
+        "max_drawdown_usd": 25.0,
+        "total_closed_trades": 5,
+    }
+    assert wide["realized_pnl_window_usd"] == 31.5
+    assert reopened == cached
+
+
+def test_window_cutoff_is_exact_within_a_minute(tmp_path):
+    now = time.time()
+
+    async def main():
+        log = await _opened(tmp_path / "log.db")
+        try:
+            # Either side of the cutoff, which rarely falls on a minute.
+            await log.append_event(_close(2.0, now - 3600 + 5))
+            await log.append_event(_close(3.0, now - 3600 - 5))
+            return await log.compute_pnl_summary(1)
+        finally:
+            await log.close()
+
+    summary = asyncio.run(main())
+    assert summary["realized_pnl_window_usd"] == 2.0
+    assert summary["cumulative_pnl_usd"] == 5.0
+
+
+def test_readers_return_to_the_pool_and_close_even_when_borrowed(tmp_path):
+    async def main():
+        log = await _opened(tmp_path / "log.db")
+        for i in range(3):
+            await log.append_event({"type": EVENT_TRADE_OPEN, "payload": {"i": i}})
+        readers = list(log._reader_conns)
+        assert len(await log.fetch_events()) == 3
+        idle_after_fetch = log._readers.qsize()
+
+        it = log.iter_events()
+        async for _ in it:
+            break
+        idle_while_borrowed = log._readers.qsize()
+        await it.aclose()
+        idle_after_aclose = log._readers.qsize()
+
+        abandoned = log.iter_events_since(0)
+        await abandoned.__anext__()
+        await log.close()
+        closed = 0
+        for conn in readers:
+            with pytest.raises(ValueError):
+                await conn.execute("SELECT 1")
+            closed += 1
+        with pytest.raises(ValueError):  # its reader was closed under it
+            await abandoned.aclose()
+        return idle_after_fetch, idle_while_borrowed, idle_after_aclose, closed
+
+    pool = performance_log.READER_POOL_SIZE
+    assert asyncio.run(main()) == (pool, pool - 1, pool, pool)
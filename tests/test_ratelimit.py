@@ -0,0 +1,81 @@
+"""TokenBucket and the shared Retry-After policy."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from clients.ratelimit import MAX_RETRY_AFTER_S, TokenBucket, retry_after_s
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+
+
+def test_try_acquire_spends_capacity_then_refuses():
+    bucket = TokenBucket(rate=0.001, capacity=2)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_release_returns_the_token():
+    bucket = TokenBucket(rate=0.001, capacity=1)
+    assert bucket.try_acquire()
+    bucket.release()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_daily_cap_applies_on_top_of_the_rate():
+    bucket = TokenBucket(rate=1000, capacity=1000, daily_cap=2)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    bucket.release()
+    assert bucket.try_acquire()
+
+
+def test_acquire_waits_for_refill():
+    async def main():
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # Two refills at 20/s take ~0.1 s.
+    assert 0.08 <= asyncio.run(main()) < 1.0
+
+
+def test_try_acquire_does_not_jump_the_queue():
+    async def main():
+        bucket = TokenBucket(rate=10, capacity=1)
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        refused = not bucket.try_acquire()
+        await waiter
+        return refused
+
+    assert asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, 2.0),
+        ("0", 0.0),
+        ("1.5", 1.5),
+        ("3600", MAX_RETRY_AFTER_S),
+        ("-5", 0.0),
+        ("inf", 2.0),
+        ("nan", 2.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 2.0),
+    ],
+)
+def test_retry_after_is_clamped(header, expected):
+    headers = {"Retry-After": header} if header is not None else {}
+    assert retry_after_s(httpx.Response(429, headers=headers), 2.0) == expected